@@ -1,6 +1,16 @@
+import sys
+from pathlib import Path
+
 from manim import *
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from toolkit.codeblock import CodeDiff, cached_code  # noqa: E402
+from toolkit.geometry import install_svg_cache  # noqa: E402
+from toolkit.glyphs import GlyphGrid  # noqa: E402
+
+install_svg_cache()
 np.random.seed(0)
 
 
@@ -28,7 +38,7 @@ class SourceFile(Scene):
         # print(Code.styles_list)
         cpp_file_title = Text("C++")
         c_file_title = Text("C")
-        cpp_file_content = Code(
+        cpp_file_content = cached_code(
             "hello_world.cpp",
             tab_width=4,
             background="window",
@@ -36,7 +46,7 @@ class SourceFile(Scene):
             style="github-dark",
             font="XHei NF",
         )
-        c_file_content = Code(
+        c_file_content = cached_code(
             "hello_world.c",
             tab_width=4,
             background="window",
@@ -195,7 +205,7 @@ class CompileDetails(Scene):
         ch_3_title.target.to_edge(UL)
         ch_3_title.target.scale(0.75)
 
-        code_source = Code(
+        code_source = cached_code(
             "hello_world.c",
             tab_width=4,
             background="window",
@@ -203,7 +213,7 @@ class CompileDetails(Scene):
             style="github-dark",
             font="XHei NF",
         )
-        code_processed = Code(
+        code_processed = cached_code(
             "hello_world.i",
             tab_width=4,
             background="window",
@@ -211,7 +221,7 @@ class CompileDetails(Scene):
             style="github-dark",
             font="XHei NF",
         )
-        code_compiled = Code(
+        code_compiled = cached_code(
             "hello_world.s",
             tab_width=4,
             background="window",
@@ -219,7 +229,7 @@ class CompileDetails(Scene):
             style="github-dark",
             font="XHei NF",
         )
-        code_assembled = Paragraph(
+        code_assembled = GlyphGrid(
             *[
                 "".join(map(str, line))
                 for line in np.random.randint(0, 2, 32).reshape(-1, 8).tolist()
@@ -233,20 +243,22 @@ class CompileDetails(Scene):
             color=YELLOW,
             font="XHei NF",
         ).scale(0.5)
-        code_printf = Paragraph(
+        code_printf = GlyphGrid(
             *[
                 "".join(map(str, line))
                 for line in np.random.randint(0, 2, 36).reshape(6, -1).tolist()
             ],
+            alphabet="01",
             alignment="center",
             color=BLUE,
             font="XHei NF",
         ).scale(0.5)
-        code_executable = Paragraph(
+        code_executable = GlyphGrid(
             *[
                 "".join(map(str, line))
                 for line in np.random.randint(0, 2, 96).reshape(8, -1).tolist()
             ],
+            alphabet="01",
             alignment="center",
             color=GREEN,
             font="XHei NF",
@@ -470,7 +482,7 @@ class APlusB(Scene):
         t_title.target.to_edge(UL)
         t_title.target.scale(0.75)
 
-        code_ff = Code(
+        code_ff = cached_code(
             "APlusBFF.c",
             tab_width=4,
             background="window",
@@ -478,7 +490,7 @@ class APlusB(Scene):
             style="github-dark",
             font="XHei NF",
         )
-        code_f = Code(
+        code_f = cached_code(
             "APlusBF.c",
             tab_width=4,
             background="window",
@@ -486,7 +498,7 @@ class APlusB(Scene):
             style="github-dark",
             font="XHei NF",
         )
-        code_t = Code(
+        code_t = cached_code(
             "APlusB.c",
             tab_width=4,
             background="window",
@@ -602,12 +614,10 @@ class APlusB(Scene):
         v_sum.become(VMobject())
         code_f.scale(0.75).move_to(code_ff).align_to(code_ff, UP)
         self.play(
-            Transform(code_ff, code_f),
+            CodeDiff(code_ff, code_f),
             Transform(t_source, Text("A+B??").scale(0.75).next_to(code_f, UP)),
             g_breakpoint.animate.align_to(code_ff.code[4], DOWN),
         )
-        self.add(code_f)
-        self.remove(code_ff)
         self.wait(2)
         self.play(g_breakpoint.animate.align_to(code_f.code[5], DOWN))
         self.play(Circumscribe(code_f.code[5], color=RED))
@@ -670,14 +680,12 @@ class APlusB(Scene):
         v_a.become(VMobject())
         v_b.become(VMobject())
         v_sum.become(VMobject())
-        code_t.scale(0.75).move_to(code_f).align_to(code_ff, UP)
+        code_t.scale(0.75).move_to(code_f).align_to(code_f, UP)
         self.play(
-            Transform(code_f, code_t),
+            CodeDiff(code_f, code_t),
             Transform(t_source, Text("A+B").scale(0.75).next_to(code_f, UP)),
             g_breakpoint.animate.align_to(code_f.code[4], DOWN),
         )
-        self.add(code_t)
-        self.remove(code_f)
         self.wait(2)
         self.play(
             g_breakpoint.animate.align_to(code_t.code[5], DOWN),
@@ -796,7 +804,7 @@ class Conclusion(Scene):
         )
         VGroup(l_1, l_2, l_3).center()
 
-        code_source = Code(
+        code_source = cached_code(
             "GoodExample.cpp",
             tab_width=4,
             background="window",
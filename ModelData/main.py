@@ -1,9 +1,30 @@
+import itertools
+import sys
+from pathlib import Path
+
 import manim as mm
 import numpy as np
-from scipy.optimize import curve_fit
-from sklearn.gaussian_process import GaussianProcessRegressor as GPR
-from sklearn.gaussian_process.kernels import RBF
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from toolkit.bootstrap import BootstrapBand  # noqa: E402
+from toolkit.codeblock import cached_code  # noqa: E402
+from toolkit.data import load  # noqa: E402
+from toolkit.density import DensityMap  # noqa: E402
+from toolkit.fitting import (  # noqa: E402
+    curve_fit_batch,
+    saturating,
+    saturating_jacobian,
+)
+from toolkit.geometry import install_svg_cache  # noqa: E402
+from toolkit.gp import GPCurve, OnlineGP  # noqa: E402
+from toolkit.interpolate import BarycentricInterpolant  # noqa: E402
+from toolkit.plotting import TrackedGraph, plot  # noqa: E402
+from toolkit.scatter import DotCloud  # noqa: E402
+from toolkit.segments import SegmentBatch  # noqa: E402
+from toolkit.streaming import RunningLinearFit  # noqa: E402
+
+install_svg_cache()
 np.random.seed(1234)
 
 
@@ -57,11 +78,8 @@ class Regression(mm.Scene):
         )
         self.wait(1)
 
-        points = mm.VGroup(
-            *[
-                mm.Dot(number_plane.c2p(x[i], y[i]), color=mm.RED, fill_opacity=0.75)
-                for i in range(len(x))
-            ]
+        points = DotCloud.from_coords(
+            number_plane, x, y, color=mm.RED, fill_opacity=0.75
         )
         self.play(mm.FadeOut(line), mm.Create(points))
         number_plane.remove(line)
@@ -79,15 +97,11 @@ class Regression(mm.Scene):
 
         a = mm.ValueTracker(1)
         b = mm.ValueTracker(0)
-        fitted = number_plane.plot(
-            lambda x: a.get_value() * x + b.get_value(), color=mm.WHITE
-        )
-        fitted.add_updater(
-            lambda m: m.become(
-                number_plane.plot(
-                    lambda x: a.get_value() * x + b.get_value(), color=mm.WHITE
-                )
-            )  # type: ignore
+        fitted = TrackedGraph(
+            number_plane,
+            lambda x, slope, intercept: slope * x + intercept,
+            [a, b],
+            color=mm.WHITE,
         )
         self.play(mm.Create(fitted))
         self.play(
@@ -146,15 +160,8 @@ class Regression(mm.Scene):
         self.wait(1)
 
         y_nonlinear = 2 * np.tanh(x) + np.random.normal(0, 0.5, 100)
-        points_nonlinear = mm.VGroup(
-            *[
-                mm.Dot(
-                    number_plane.c2p(x[i], y_nonlinear[i]),
-                    color=mm.RED,
-                    fill_opacity=0.75,
-                )
-                for i in range(len(x))
-            ]
+        points_nonlinear = DotCloud.from_coords(
+            number_plane, x, y_nonlinear, color=mm.RED, fill_opacity=0.75
         )
         self.play(mm.ReplacementTransform(points, points_nonlinear))
         self.wait(1)
@@ -189,6 +196,119 @@ class Regression(mm.Scene):
         self.wait(1)
 
 
+class RegressionStream(mm.Scene):
+    def construct(self):
+        STEPS = 17
+        DOT_STEPS = 10
+        FIRST = 10
+
+        def observations():
+            # Each step observes twice as many new points as the last.
+            size = FIRST
+            while True:
+                x = np.random.uniform(-5, 5, size)
+                yield x, x / 2 + 1 + np.random.normal(0, 0.5, size)
+                size *= 2
+
+        title = mm.Text("在线回归", color=mm.BLUE).scale(2)
+        self.play(mm.Write(title))
+        self.wait(1)
+        self.play(
+            title.animate.scale(0.5).set_color(mm.WHITE).to_corner(mm.UP + mm.LEFT)
+        )
+
+        number_plane = mm.NumberPlane(
+            x_range=[-5, 5, 1],
+            y_range=[-5, 5, 1],
+            x_length=7,
+            y_length=7,
+            axis_config={"include_tip": False},
+        ).to_edge(mm.RIGHT)
+        formula = (
+            mm.MathTex(R"{{ \hat{y} }}={{ a }}{{ x }}+{{ b }}")
+            .set_color_by_tex(" a ", mm.RED)
+            .set_color_by_tex(" b ", mm.BLUE)
+            .to_edge(mm.LEFT, buff=1.5)
+        )
+        self.play(mm.Create(number_plane), mm.Write(formula))
+        self.wait(1)
+
+        fit = RunningLinearFit()
+        stream = observations()
+        x, y = next(stream)
+        fit.update(x, y)
+        points = DotCloud.from_coords(
+            number_plane, x, y, radius=0.03, color=mm.RED, fill_opacity=0.5
+        )
+        # Kept up to date alongside the dots; drawn under the grid.
+        density = DensityMap.from_coords(number_plane, x, y).set_z_index(-1)
+        a = mm.ValueTracker(fit.slope)
+        b = mm.ValueTracker(fit.intercept)
+        fitted = TrackedGraph(
+            number_plane,
+            lambda x, slope, intercept: slope * x + intercept,
+            [a, b],
+            color=mm.WHITE,
+        )
+
+        a_label = mm.MathTex("{{ a }}=").set_color_by_tex(" a ", mm.RED)
+        a_num = mm.DecimalNumber(a.get_value(), num_decimal_places=2).next_to(
+            a_label, mm.RIGHT
+        )
+        mm.VGroup(a_label, a_num).next_to(formula, mm.DOWN)
+        b_label = mm.MathTex("{{ b }}=").set_color_by_tex(" b ", mm.BLUE)
+        b_num = mm.DecimalNumber(b.get_value(), num_decimal_places=2).next_to(
+            b_label, mm.RIGHT
+        )
+        mm.VGroup(b_label, b_num).next_to(mm.VGroup(a_label, a_num), mm.DOWN).align_to(
+            mm.VGroup(a_label, a_num), mm.LEFT
+        )
+        n = mm.ValueTracker(fit.n)
+        n_label = mm.MathTex("n=")
+        n_num = mm.Integer(fit.n).next_to(n_label, mm.RIGHT)
+        mm.VGroup(n_label, n_num).next_to(mm.VGroup(b_label, b_num), mm.DOWN).align_to(
+            mm.VGroup(b_label, b_num), mm.LEFT
+        )
+        a_num.add_updater(
+            lambda m: m.set_value(a.get_value()).next_to(a_label, mm.RIGHT)
+        )
+        b_num.add_updater(
+            lambda m: m.set_value(b.get_value()).next_to(b_label, mm.RIGHT)
+        )
+        n_num.add_updater(
+            lambda m: m.set_value(n.get_value()).next_to(n_label, mm.RIGHT)
+        )
+        self.play(mm.Create(points), mm.Create(fitted))
+        self.play(mm.Write(mm.VGroup(a_label, a_num, b_label, b_num, n_label, n_num)))
+        self.wait(1)
+
+        # The dots and the histogram grow in place and the fit only folds in
+        # the new batch, so each step costs the size of the batch, not of
+        # everything seen. Past `DOT_STEPS` the dots give way to the density.
+        for step, (x, y) in enumerate(itertools.islice(stream, STEPS - 1), 1):
+            fit.update(x, y)
+            density.add(x, y)
+            if step < DOT_STEPS:
+                points.append_coords(number_plane, x, y)
+            elif step == DOT_STEPS:
+                self.play(mm.FadeOut(points), mm.FadeIn(density))
+            self.play(
+                a.animate.set_value(fit.slope),
+                b.animate.set_value(fit.intercept),
+                n.animate.set_value(fit.n),
+                run_time=0.5,
+            )
+        self.play(
+            mm.ShowPassingFlash(
+                fitted.copy().set_color(mm.GREEN),  # type: ignore
+            )
+        )
+        self.wait(1)
+
+        self.play(*[mm.FadeOut(mob) for mob in self.mobjects])
+        self.wait(1)
+
+
 class Reverse(mm.Scene):
     def construct(self):
         N = 50
@@ -220,12 +340,7 @@ class Reverse(mm.Scene):
         ).next_to(arrow, mm.RIGHT)
         x = np.random.uniform(-2, 2, N)
         y = x / 2 + np.sin(x * 3 * np.pi) / 2 + np.random.normal(0, 0.1, N)
-        points = mm.VGroup(
-            *[
-                mm.Dot(axes.c2p(x[i], y[i]), color=mm.RED, fill_opacity=0.8)
-                for i in range(N)
-            ]
-        )
+        points = DotCloud.from_coords(axes, x, y, color=mm.RED, fill_opacity=0.8)
         self.play(mm.ReplacementTransform(model_text, model))
         self.wait(1)
         self.play(mm.ReplacementTransform(data_text, axes))
@@ -255,22 +370,15 @@ class Reverse(mm.Scene):
         )
 
         func_linear = lambda x: x / 2
-        plot_linear = axes.plot(func_linear)
+        plot_linear = plot(axes, func_linear)
         self.play(
             mm.ReplacementTransform(model_backwards, model_linear),
             mm.Create(plot_linear),
         )
         self.wait(1)
 
-        error_linear = mm.VGroup(
-            *[
-                mm.Line(
-                    axes.c2p(x[i], y[i]),
-                    axes.c2p(x[i], func_linear(x[i])),
-                    color=mm.YELLOW,
-                )
-                for i in range(N)
-            ]
+        error_linear = SegmentBatch.from_coords(
+            axes, x, y, x, func_linear(x), color=mm.YELLOW
         )
         self.play(mm.Create(error_linear))
         self.wait(1)
@@ -288,22 +396,15 @@ class Reverse(mm.Scene):
             .set_color_by_tex(" c ", mm.GREEN)
             .move_to(mm.LEFT * 3)
         )
-        plot_nonlinear = axes.plot(func_nonlinear)
+        plot_nonlinear = plot(axes, func_nonlinear)
         self.play(
             mm.ReplacementTransform(model_linear, model_nonlinear),
             mm.ReplacementTransform(plot_linear, plot_nonlinear),
         )
         self.wait(1)
 
-        error_nonlinear = mm.VGroup(
-            *[
-                mm.Line(
-                    axes.c2p(x[i], y[i]),
-                    axes.c2p(x[i], func_nonlinear(x[i])),
-                    color=mm.YELLOW,
-                )
-                for i in range(N)
-            ]
+        error_nonlinear = SegmentBatch.from_coords(
+            axes, x, y, x, func_nonlinear(x), color=mm.YELLOW
         )
         self.play(mm.Create(error_nonlinear))
         self.wait(1)
@@ -316,13 +417,7 @@ class Reverse(mm.Scene):
         L = 24
         xx = np.linspace(-2, 2, L)
         yy = func_nonlinear(xx)
-        l = [
-            lambda x, i=i: np.prod(x - xx[:i])
-            * np.prod(x - xx[i + 1 :])
-            / (np.prod(xx[i] - xx[:i]) * np.prod(xx[i] - xx[i + 1 :]))
-            for i in range(L)
-        ]
-        func_nonlinear_lagrange = lambda x: sum([l[i](x) * yy[i] for i in range(L)])
+        func_nonlinear_lagrange = BarycentricInterpolant(xx, yy)
         model_nonlinear_lagrange = (
             mm.MathTex(R"{{ \hat{y} }}={{ k_0 }}+{{ k_1 }}x+{{ k_2 }}x^2+{{ \cdots }}")
             .set_color_by_tex(" k_0 ", mm.GREEN)
@@ -330,7 +425,7 @@ class Reverse(mm.Scene):
             .set_color_by_tex(" k_2 ", mm.GREEN)
             .move_to(mm.LEFT * 3)
         )
-        plot_nonlinear_lagrange = axes.plot(func_nonlinear_lagrange)
+        plot_nonlinear_lagrange = plot(axes, func_nonlinear_lagrange)
         self.play(
             mm.ReplacementTransform(model_nonlinear, model_nonlinear_lagrange),
             mm.ReplacementTransform(plot_nonlinear, plot_nonlinear_lagrange),
@@ -813,10 +908,8 @@ class Derivation(mm.Scene):
         ).next_to(arrow, mm.RIGHT)
         x = np.linspace(0, 4, N)
         y = (1 - np.exp(-x / 2)) * 5 + np.random.normal(0, 0.25, N)
-        points = mm.VGroup(
-            *[mm.Dot(axes.c2p(x[i], y[i]), color=mm.RED) for i in range(len(x))]
-        )
-        fitted = axes.plot(lambda x: (1 - np.exp(-x / 2)) * 5)
+        points = DotCloud.from_coords(axes, x, y, color=mm.RED)
+        fitted = plot(axes, lambda x: (1 - np.exp(-x / 2)) * 5)
         self.play(
             mm.FadeOut(model_derived_text),
             mm.Create(axes),
@@ -842,6 +935,10 @@ class Fitting(mm.Scene):
         }
         N = 5
         FUNC = lambda x: (1 - np.exp(-x / 2)) * 5
+        # Real measurements replace the synthesised ones when present.
+        DATA = Path("./assets/data.csv")
+        # At most this many of them are drawn; the fits use every row.
+        DOTS = 2000
         CODE_CONFIG = {
             "tab_width": 4,
             "background": "window",
@@ -857,8 +954,14 @@ class Fitting(mm.Scene):
             title.animate.scale(0.5).set_color(mm.WHITE).to_corner(mm.UP + mm.LEFT)
         )
 
-        x = np.arange(N)
-        y = FUNC(x) + np.random.normal(0, 0.15, N)
+        data = load(DATA, columns=["x", "y"]) if DATA.is_file() else None
+        if data is not None and len(data[0]) < 2:
+            raise ValueError(f"{DATA} has {len(data[0])} rows, the fit needs two")
+        if data is None:
+            x = np.arange(N)
+            y = FUNC(x) + np.random.normal(0, 0.15, N)
+        else:
+            x, y = (column[:N] for column in data)
         table_hori = mm.DecimalTable(
             [x, y],
             row_labels=[
@@ -871,7 +974,7 @@ class Fitting(mm.Scene):
         self.wait(1)
 
         table_vert = mm.DecimalTable(
-            [[x[i], y[i]] for i in range(N)],
+            [[x[i], y[i]] for i in range(len(x))],
             col_labels=[
                 mm.MathTex(R"t"),
                 mm.MathTex(R"[{{ P }}]").set_color_by_tex_to_color_map(CMAP),
@@ -881,8 +984,10 @@ class Fitting(mm.Scene):
         self.play(mm.ReplacementTransform(table_hori, table_vert))
         self.wait(1)
 
-        file_content = mm.Code(
-            code="\n".join(["x,y"] + [f"{x[i]:.01f},{y[i]:.03f}" for i in range(N)]),
+        file_content = cached_code(
+            code="\n".join(
+                ["x,y"] + [f"{x[i]:.01f},{y[i]:.03f}" for i in range(len(x))]
+            ),
             language="text",
             **CODE_CONFIG | {"style": "default"},
         ).scale(1.5)
@@ -915,7 +1020,7 @@ class Fitting(mm.Scene):
         self.wait(1)
 
         python_text = mm.Text("Python").move_to(mm.LEFT * 3)
-        python_code = mm.Code(
+        python_code = cached_code(
             "./assets/fit.py", language="python", **CODE_CONFIG
         ).to_edge(mm.RIGHT)
         self.play(mm.Write(python_code))
@@ -926,7 +1031,7 @@ class Fitting(mm.Scene):
         self.wait(1)
 
         R_text = mm.Text("R").move_to(mm.LEFT * 3)
-        R_code = mm.Code("./assets/fit.R", language="R", **CODE_CONFIG).to_edge(
+        R_code = cached_code("./assets/fit.R", language="R", **CODE_CONFIG).to_edge(
             mm.RIGHT
         )
         self.play(
@@ -939,7 +1044,7 @@ class Fitting(mm.Scene):
         self.wait(1)
 
         matlab_text = mm.Text("Matlab").move_to(mm.LEFT * 3)
-        matlab_code = mm.Code(
+        matlab_code = cached_code(
             "./assets/fit.m", language="matlab", **CODE_CONFIG
         ).to_edge(mm.RIGHT)
         self.play(
@@ -956,11 +1061,25 @@ class Fitting(mm.Scene):
         self.play(mm.Write(equation_model))
         self.wait(1)
 
-        N = 10
-        x = np.arange(N) / 2
-        y = FUNC(x) + np.random.normal(0, 0.15, N)
-        model = lambda x, a, b: (1 - np.exp(-a * x)) * b
-        popt, pcov = curve_fit(model, x, y)
+        def axis_range(values) -> list[float]:
+            # From zero, where the model starts, in about five round steps.
+            low, high = min(values.min(), 0.0), max(values.max(), 0.0)
+            unit = 10 ** np.floor(np.log10(max(high - low, 1e-9) / 5))
+            step = next(unit * m for m in (1, 2, 5, 10) if high - low <= 5 * unit * m)
+            return [np.floor(low / step) * step, np.ceil(high / step) * step, step]
+
+        if data is None:
+            N = 10
+            x = np.arange(N) / 2
+            y = FUNC(x) + np.random.normal(0, 0.15, N)
+            x_range, y_range = [0, 5, 1], [0, 5, 1]
+        else:
+            x, y = data
+            N = len(x)
+            x_range, y_range = axis_range(x), axis_range(y)
+        shown = slice(None) if N <= DOTS else np.random.permutation(N)[:DOTS]
+        fit = curve_fit_batch(saturating, saturating_jacobian, x, y, p0=(1, 1))
+        popt = fit.params[0]
         fitted_a_label = (
             mm.MathTex(R"{{ a }}=").set_color_by_tex_to_color_map(CMAP).scale(2)
         )
@@ -1016,56 +1135,100 @@ class Fitting(mm.Scene):
         self.wait(1)
 
         axes = mm.Axes(
-            x_range=[0, 5, 1],
-            y_range=[0, 5, 1],
+            x_range=x_range,
+            y_range=y_range,
             x_length=6,
             y_length=6,
             axis_config={"include_tip": False},
         ).to_edge(mm.RIGHT)
-        points = mm.VGroup(
-            *[mm.Dot(axes.c2p(_x, _y), color=mm.RED) for _x, _y in zip(x, y)]
-        )
-        line_fitted = axes.plot(
-            lambda x: (1 - np.exp(-value_a.get_value() * x)) * value_b.get_value(),
+        points = DotCloud.from_coords(axes, x[shown], y[shown], color=mm.RED)
+        line_fitted = TrackedGraph(
+            axes,
+            lambda x, a, b: (1 - np.exp(-a * x)) * b,
+            [value_a, value_b],
             color=mm.BLUE,
         )
-        line_fitted.add_updater(
-            lambda l: l.become(
-                axes.plot(
-                    lambda x: (1 - np.exp(-value_a.get_value() * x))
-                    * value_b.get_value(),
-                    color=mm.BLUE,
-                )
-            )  # type: ignore
-        )
         self.play(mm.Write(axes))
         self.play(mm.Write(points))
         self.play(mm.Write(line_fitted))
         self.wait(1)
 
-        line_actuale = mm.DashedVMobject(axes.plot(FUNC))
-        self.play(mm.Write(line_actuale))
-        self.wait(1)
+        if data is None:
+            line_actuale = mm.DashedVMobject(plot(axes, FUNC))
+            self.play(mm.Write(line_actuale))
+            self.wait(1)
 
-        for _ in range(3):
-            y = FUNC(x) + np.random.normal(0, 0.15, N)
-            popt, pcov = curve_fit(model, x, y)
-            self.play(
-                points.animate.become(
-                    mm.VGroup(
-                        *[
-                            mm.Dot(axes.c2p(_x, _y), color=mm.RED)
-                            for _x, _y in zip(x, y)
-                        ]
-                    )
-                )
-            )
+            resample_x = np.broadcast_to(x, (3, N))
+            resamples = FUNC(x) + np.random.normal(0, 0.15, (3, N))
+        else:
+            # Measured data has no known curve to draw new samples from, so
+            # the replicates are drawn from its own rows.
+            rows = np.random.randint(0, N, (3, N))
+            resample_x, resamples = x[rows], y[rows]
+        fits = curve_fit_batch(
+            saturating, saturating_jacobian, resample_x, resamples, p0=(1, 1)
+        )
+        for x, y, popt in zip(resample_x, resamples, fits.params):
+            resampled = DotCloud.from_coords(axes, x[shown], y[shown], color=mm.RED)
+            self.play(points.animate.become(resampled))
             self.play(
                 value_a.animate.set_value(popt[0]), value_b.animate.set_value(popt[1])
             )
             self.wait(1)
 
 
+class FittingBootstrap(mm.Scene):
+    def construct(self):
+        N = 10
+        RESAMPLES = 5000
+        BATCH = 250
+        FUNC = lambda x: (1 - np.exp(-x / 2)) * 5
+
+        title = mm.Text("自助法", color=mm.BLUE).scale(2)
+        self.play(mm.Write(title))
+        self.wait(1)
+        self.play(
+            title.animate.scale(0.5).set_color(mm.WHITE).to_corner(mm.UP + mm.LEFT)
+        )
+
+        axes = mm.Axes(
+            x_range=[0, 5, 1],
+            y_range=[0, 5, 1],
+            x_length=6,
+            y_length=6,
+            axis_config={"include_tip": False},
+        ).to_edge(mm.RIGHT)
+        x = np.arange(N) / 2
+        y = FUNC(x) + np.random.normal(0, 0.15, N)
+        points = DotCloud.from_coords(axes, x, y, color=mm.RED)
+        line_actuale = mm.DashedVMobject(plot(axes, FUNC))
+        self.play(mm.Write(axes))
+        self.play(mm.Write(points), mm.Write(line_actuale))
+        self.wait(1)
+
+        count = mm.ValueTracker(0)
+        count_label = mm.MathTex("n=").scale(1.5)
+        count_text = mm.Integer(0).scale(1.5).next_to(count_label, mm.RIGHT)
+        count_text.add_updater(lambda v: v.set_value(count.get_value()))
+        mm.VGroup(count_label, count_text).to_edge(mm.LEFT, buff=1.5)
+        self.play(mm.Write(count_label), mm.Write(count_text))
+
+        band = BootstrapBand(axes, saturating)
+        for start in range(0, RESAMPLES, BATCH):
+            resamples = FUNC(x) + np.random.normal(0, 0.15, (BATCH, N))
+            fits = curve_fit_batch(
+                saturating, saturating_jacobian, x, resamples, p0=(1, 1)
+            )
+            band.add(fits.params)
+            if start == 0:
+                region = band.region(color=mm.BLUE)
+                grow = mm.FadeIn(region)
+            else:
+                grow = mm.Transform(region, band.region(color=mm.BLUE))
+            self.play(grow, count.animate.set_value(start + BATCH), run_time=0.4)
+        self.wait(1)
+
+
 class Next(mm.Scene):
     def construct(self):
         CMAP = {
@@ -1101,23 +1264,16 @@ class Next(mm.Scene):
         ).to_edge(mm.RIGHT)
         x = np.arange(N) / 2
         y = FUNC(x) + np.random.normal(0, 0.15, N)
-        points = mm.VGroup(
-            *[mm.Dot(axes.c2p(x[i], y[i]), color=mm.RED) for i in range(N)]
-        )
+        points = DotCloud.from_coords(axes, x, y, color=mm.RED)
         self.play(mm.ReplacementTransform(verfiy_text, R2))
         self.play(mm.Write(axes), mm.Write(points))
         self.wait(1)
 
-        line_mean = axes.plot(lambda x: y.mean())
+        line_mean = plot(axes, lambda x: y.mean())
         self.play(mm.Write(line_mean))
         self.wait(1)
 
-        error_mean = mm.VGroup(
-            *[
-                mm.Line(axes.c2p(x[i], y.mean()), axes.c2p(x[i], y[i]), color=mm.YELLOW)
-                for i in range(N)
-            ]
-        )
+        error_mean = SegmentBatch.from_coords(axes, x, y.mean(), x, y, color=mm.YELLOW)
         self.play(mm.Write(error_mean))
         self.wait(1)
 
@@ -1135,7 +1291,10 @@ class Next(mm.Scene):
             .arrange(buff=0.1)
             .next_to(R2, mm.DOWN, buff=0.5)
         )
-        self.play(mm.ReplacementTransform(error_mean, error_mean_squared))
+        # Each residual turns into its own square, so hand the transform one
+        # mobject per segment.
+        self.remove(error_mean)
+        self.play(mm.ReplacementTransform(error_mean.split(), error_mean_squared))
         self.wait(1)
 
         S_tot = (
@@ -1147,16 +1306,11 @@ class Next(mm.Scene):
         self.play(mm.ReplacementTransform(error_mean_squared, S_tot))
         self.wait(1)
 
-        line_model = axes.plot(lambda x: FUNC(x))
+        line_model = plot(axes, lambda x: FUNC(x))
         self.play(mm.ReplacementTransform(line_mean, line_model))
         self.wait(1)
 
-        error_model = mm.VGroup(
-            *[
-                mm.Line(axes.c2p(x[i], FUNC(x[i])), axes.c2p(x[i], y[i]), color=mm.BLUE)
-                for i in range(N)
-            ]
-        )
+        error_model = SegmentBatch.from_coords(axes, x, FUNC(x), x, y, color=mm.BLUE)
         self.play(mm.Write(error_model))
         self.wait(1)
 
@@ -1174,7 +1328,10 @@ class Next(mm.Scene):
             .arrange(buff=0.1)
             .next_to(R2, mm.UP, buff=0.5)
         )
-        self.play(mm.ReplacementTransform(error_model, error_model_squared))
+        # Each residual turns into its own square, so hand the transform one
+        # mobject per segment.
+        self.remove(error_model)
+        self.play(mm.ReplacementTransform(error_model.split(), error_model_squared))
         self.wait(1)
 
         S_res = (
@@ -1270,6 +1427,8 @@ class Next(mm.Scene):
 
 class Conclusion(mm.Scene):
     def construct(self):
+        from sklearn.gaussian_process.kernels import RBF
+
         title = mm.Text("总结", color=mm.BLUE).scale(2)
         self.play(mm.Write(title))
         self.wait(1)
@@ -1435,36 +1594,28 @@ class Conclusion(mm.Scene):
         self.wait(1)
 
         kernel = 1 * RBF() + 0
-        gpr = GPR(kernel)
+        gpr = OnlineGP(kernel, reoptimize_every=1)
         x = np.array([-2, 1, 0])
         y = np.array([1, -1, 0])
-        line_0 = axes.plot(
-            lambda x: gpr.predict(np.array([x]).reshape(-1, 1)).squeeze()  # type: ignore
-        )
+        line_0 = GPCurve(axes, gpr)
         self.play(mm.Create(line_0))
         self.wait(1)
 
         point_1 = mm.Dot(axes.c2p(x[0], y[0]), color=mm.RED)
-        gpr.fit(x[:1].reshape(-1, 1), y[:1].reshape(-1, 1))
-        line_1 = axes.plot(
-            lambda x: gpr.predict(np.array([x]).reshape(-1, 1)).squeeze()  # type: ignore
-        )
+        gpr.add(x[0], y[0])
+        line_1 = GPCurve(axes, gpr)
         self.play(mm.Create(point_1), mm.ReplacementTransform(line_0, line_1))
         self.wait(1)
 
         point_2 = mm.Dot(axes.c2p(x[1], y[1]), color=mm.RED)
-        gpr.fit(x[:2].reshape(-1, 1), y[:2].reshape(-1, 1))
-        line_2 = axes.plot(
-            lambda x: gpr.predict(np.array([x]).reshape(-1, 1)).squeeze()  # type: ignore
-        )
+        gpr.add(x[1], y[1])
+        line_2 = GPCurve(axes, gpr)
         self.play(mm.Create(point_2), mm.ReplacementTransform(line_1, line_2))
         self.wait(1)
 
         point_3 = mm.Dot(axes.c2p(x[2], y[2]), color=mm.RED)
-        gpr.fit(x[:3].reshape(-1, 1), y[:3].reshape(-1, 1))
-        line_3 = axes.plot(
-            lambda x: gpr.predict(np.array([x]).reshape(-1, 1)).squeeze()  # type: ignore
-        )
+        gpr.add(x[2], y[2])
+        line_3 = GPCurve(axes, gpr)
         self.play(mm.Create(point_3), mm.ReplacementTransform(line_2, line_3))
         self.wait(1)
 
@@ -0,0 +1 @@
+"""Shared build and rendering helpers for the explanation projects."""
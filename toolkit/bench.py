@@ -0,0 +1,222 @@
+"""Render benchmarks with a local history and regression detection.
+
+Every scene is rendered serially at low quality with caching disabled, so each
+run does the full work. Wall time, CPU time, peak RSS, frames and frames per
+second are appended to a history file, and a scene is flagged when it is slower
+or larger than the median of its recent runs by more than the threshold.
+
+Usage: python -m toolkit.bench [-n RUNS] [--threshold RATIO] [NAME ...]
+
+NAME is a micro-benchmark (see MICRO_BENCHMARKS) or `Project:Scene`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .build import PROJECTS, ROOT, render_env
+from .scenes import ENTRYPOINT, SceneIndex
+
+HISTORY = ROOT / "media" / "bench-history.jsonl"
+MICRO_BENCHMARKS = {
+    # batched curve_fit_batch fits, a bootstrap band and vectorized graphs
+    "fitting": "ModelData:Fitting",
+    # large grids of random bits drawn as instanced glyphs
+    "compile-details": "BasicsInProgramming:CompileDetails",
+}
+METRICS = ["wall", "cpu", "rss"]
+
+
+@dataclass
+class Measurement:
+    wall: float
+    cpu: float
+    rss: int
+    frames: int
+    returncode: int
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.wall if self.wall else 0.0
+
+
+def run_once(project: Path, scene: str, quality: str) -> Measurement:
+    with tempfile.TemporaryDirectory() as profiles:
+        command = [
+            sys.executable,
+            "-m",
+            "toolkit.profiling",
+            "--out",
+            profiles,
+            "--",
+            f"-q{quality}",
+            "--disable_caching",
+            ENTRYPOINT,
+            scene,
+        ]
+        env = render_env() | {"PYTHONHASHSEED": "0"}
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            command,
+            cwd=project,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # wait4 gives the resource usage of this child alone.
+        _, status, usage = os.wait4(process.pid, 0)
+        wall = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        try:
+            records = json.loads((Path(profiles) / f"{scene}.json").read_text())
+        except FileNotFoundError:
+            records = []
+    return Measurement(
+        wall=wall,
+        cpu=usage.ru_utime + usage.ru_stime,
+        rss=usage.ru_maxrss * 1024,
+        frames=sum(record["frames"] for record in records),
+        returncode=process.returncode,
+    )
+
+
+def measure(project: Path, scene: str, quality: str, runs: int) -> Measurement:
+    samples = [run_once(project, scene, quality) for _ in range(runs)]
+    failed = [sample for sample in samples if sample.returncode != 0]
+    if failed:
+        return failed[0]
+    return min(samples, key=lambda sample: sample.wall)
+
+
+def load_history(path: Path) -> list[dict]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def find_regressions(
+    name: str,
+    current: Measurement,
+    history: list[dict],
+    quality: str,
+    window: int,
+    threshold: float,
+) -> list[str]:
+    previous = [
+        run["results"][name]
+        for run in history
+        if run["quality"] == quality
+        and name in run["results"]
+        and run["results"][name]["returncode"] == 0
+    ][-window:]
+    if not previous:
+        return []
+    regressions = []
+    for metric in METRICS:
+        baseline = statistics.median(result[metric] for result in previous)
+        value = getattr(current, metric)
+        if baseline > 0 and value > baseline * (1 + threshold):
+            regressions.append(f"{metric} {value / baseline - 1:+.0%}")
+    return regressions
+
+
+def git_revision() -> str:
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+
+    revision = git("rev-parse", "--short", "HEAD") or "unknown"
+    return revision + (
+        "-dirty" if git("status", "--porcelain", "--untracked-files=no") else ""
+    )
+
+
+def select(names: list[str]) -> list[str]:
+    if not names:
+        return [
+            f"{project}:{scene}"
+            for project in PROJECTS
+            for scene in SceneIndex.load(ROOT / project).scenes
+        ]
+    selected = []
+    for name in names:
+        name = MICRO_BENCHMARKS.get(name, name)
+        project, _, scene = name.partition(":")
+        if scene not in SceneIndex.load(ROOT / project).scenes:
+            raise SystemExit(f"Unknown benchmark: {name}")
+        selected.append(name)
+    return selected
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m toolkit.bench")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("-n", "--runs", type=int, default=1, help="runs per scene")
+    parser.add_argument("-q", "--quality", default="l", help="render quality")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown flagged as a regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "--window", type=int, default=5, help="past runs forming the baseline"
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY)
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    results, flagged = {}, {}
+    for name in select(args.names):
+        project, _, scene = name.partition(":")
+        result = measure(ROOT / project, scene, args.quality, args.runs)
+        results[name] = result
+        status = "FAILED" if result.returncode else "ok"
+        print(
+            f"[{status}] {name}: {result.wall:.2f}s wall, {result.cpu:.2f}s cpu,"
+            f" {result.rss / (1 << 20):.0f}MiB rss, {result.frames} frames"
+            f" ({result.fps:.1f} fps)",
+            flush=True,
+        )
+        if result.returncode == 0:
+            regressions = find_regressions(
+                name, result, history, args.quality, args.window, args.threshold
+            )
+            if regressions:
+                flagged[name] = regressions
+                print(f"  regression: {', '.join(regressions)}", flush=True)
+
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with args.history.open("a", encoding="utf-8") as history_file:
+        entry = {
+            "timestamp": time.time(),
+            "revision": git_revision(),
+            "quality": args.quality,
+            "results": {
+                name: asdict(result) | {"fps": result.fps}
+                for name, result in results.items()
+            },
+        }
+        history_file.write(json.dumps(entry) + "\n")
+
+    failed = [name for name, result in results.items() if result.returncode]
+    if failed:
+        print(f"Failed: {', '.join(failed)}", file=sys.stderr)
+    if flagged:
+        print(f"Regressions: {', '.join(flagged)}", file=sys.stderr)
+    return 1 if failed or flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
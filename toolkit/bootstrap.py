@@ -0,0 +1,73 @@
+"""Pointwise percentile bands of curves fitted to bootstrap resamples.
+
+A `BootstrapBand` collects the fitted curves on the plot's sample grid as
+batches of parameters arrive. Each batch adds one row per fit to an array,
+and `region()` turns the current percentiles into a filled VMobject. Every
+region has the same number of curves, so consecutive regions transform into
+each other without subdividing anything.
+
+Usage:
+    band = BootstrapBand(axes, saturating)
+    for params in batches:
+        band.add(params)
+        self.play(mm.Transform(region, band.region(color=mm.BLUE)))
+"""
+
+import manim as mm
+import numpy as np
+
+from .coords import coords_to_points
+from .plotting import plot_range, sample_grid, smooth_curves
+
+
+def _line(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    return mm.interpolate(start, end, np.linspace(0, 1, 4)[:, None])[None]
+
+
+class BootstrapBand:
+    """Band between the `percentiles` of `function(x, *params)` over all fits."""
+
+    def __init__(self, axes, function, x_range=None, percentiles=(2.5, 97.5)):
+        self.axes = axes
+        self.function = function
+        self.percentiles = percentiles
+        self.t = sample_grid(*plot_range(axes, x_range), axes.x_axis.scaling)
+        self.count = 0
+        self._curves = np.empty((64, len(self.t)))
+
+    @property
+    def curves(self) -> np.ndarray:
+        return self._curves[: self.count]
+
+    def add(self, params) -> "BootstrapBand":
+        """Add the curves of a (B, P) array of fitted parameters."""
+        params = np.atleast_2d(params)
+        curves = self.function(self.t, *params.T[:, :, None])
+        size = self.count + len(curves)
+        if size > len(self._curves):
+            grown = np.empty((max(size, 2 * len(self._curves)), len(self.t)))
+            grown[: self.count] = self.curves
+            self._curves = grown
+        self._curves[self.count : size] = curves
+        self.count = size
+        return self
+
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        lower, upper = np.percentile(self.curves, self.percentiles, axis=0)
+        return lower, upper
+
+    def region(self, color=mm.BLUE, fill_opacity: float = 0.4, **kwargs):
+        """The current band as a filled VMobject without stroke."""
+        lower, upper = (coords_to_points(self.axes, self.t, y) for y in self.bounds())
+        curves = np.concatenate(
+            [
+                smooth_curves(upper),
+                _line(upper[-1], lower[-1]),
+                smooth_curves(lower[::-1]),
+                _line(lower[0], upper[0]),
+            ]
+        )
+        region = mm.VMobject(
+            fill_color=color, fill_opacity=fill_opacity, stroke_width=0, **kwargs
+        )
+        return region.set_points(curves.reshape(-1, 3))
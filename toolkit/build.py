@@ -0,0 +1,259 @@
+"""Render the scenes of one or more projects on a pool of worker processes.
+
+Usage: python -m toolkit.build [-j JOBS] [-q QUALITY] [--force] [PROJECT ...]
+
+Scenes whose content hash matches the build manifest and whose output video
+still exists are not rendered again. With `--prewarm`, the LaTeX of the scenes
+left to render is compiled up front (see `toolkit.prewarm`). After the build
+the partial movie cache hit rate is reported and the cache is trimmed to
+`--cache-size`.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from .cache import DEFAULT_MAX_SIZE, PartialMovieCache, parse_size, report
+from .manifest import Manifest, scene_hashes
+from .scenes import ENTRYPOINT, SceneIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+PROJECTS = ["ModelData", "BasicsInProgramming"]
+QUALITIES = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+
+
+@dataclass
+class Job:
+    project: Path
+    scene: str
+    quality: str
+    digest: str = ""
+
+    @property
+    def name(self) -> str:
+        return f"{self.project.name}:{self.scene}"
+
+    @property
+    def log_file(self) -> Path:
+        return self.project / "media" / "logs" / "build" / f"{self.scene}.log"
+
+    @property
+    def output(self) -> Path:
+        return (
+            self.project
+            / "media"
+            / "videos"
+            / Path(ENTRYPOINT).stem
+            / QUALITIES[self.quality]
+            / f"{self.scene}.mp4"
+        )
+
+
+@dataclass
+class Result:
+    job: Job
+    returncode: int
+    elapsed: float
+
+
+def render_env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT), env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def render(job: Job, launcher: list[str], extra_args: list[str]) -> Result:
+    # Each scene is rendered by its own manim process; the pool threads only
+    # wait on them, so the work is spread over as many cores as there are jobs.
+    job.log_file.parent.mkdir(parents=True, exist_ok=True)
+    command = [*launcher, f"-q{job.quality}", *extra_args, ENTRYPOINT, job.scene]
+    start = time.perf_counter()
+    with job.log_file.open("w", encoding="utf-8") as log:
+        log.write(f"$ {' '.join(command)}\n")
+        log.flush()
+        try:
+            returncode = subprocess.run(
+                command,
+                cwd=job.project,
+                env=render_env(),
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            ).returncode
+        except OSError as error:
+            log.write(f"{error}\n")
+            returncode = 127
+    return Result(job, returncode, time.perf_counter() - start)
+
+
+def collect_jobs(
+    projects: list[Path], scenes: list[str] | None, quality: str
+) -> list[Job]:
+    indexed = [
+        (info, Job(project, name, quality))
+        for project in projects
+        for name, info in SceneIndex.load(project).scenes.items()
+        if not scenes or name in scenes
+    ]
+    if scenes:
+        missing = set(scenes) - {job.scene for _, job in indexed}
+        if missing:
+            raise SystemExit(f"Unknown scene(s): {', '.join(sorted(missing))}")
+    # Longest scenes first, so that the slowest render is not started last.
+    indexed.sort(key=lambda item: item[0].duration, reverse=True)
+    return [job for _, job in indexed]
+
+
+def hash_jobs(jobs: list[Job], extra_args: list[str]) -> None:
+    for project in dict.fromkeys(job.project for job in jobs):
+        flags = [f"-q{jobs[0].quality}", *extra_args]
+        hashes = scene_hashes(project, flags)
+        for job in jobs:
+            if job.project == project:
+                job.digest = hashes[job.scene]
+
+
+def skip_fresh(jobs: list[Job], manifests: dict[Path, Manifest]) -> list[Job]:
+    """Drop the jobs whose output was rendered from identical inputs."""
+    pending = []
+    for job in jobs:
+        key = Manifest.key(job.scene, job.quality)
+        if manifests[job.project].is_fresh(key, job.digest, job.output):
+            print(f"[fresh] {job.name}", flush=True)
+        else:
+            pending.append(job)
+    return pending
+
+
+def build(
+    jobs: list[Job],
+    workers: int,
+    launcher: list[str],
+    extra_args: list[str],
+    manifests: dict[Path, Manifest],
+) -> list[Result]:
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as pool:
+        futures = [pool.submit(render, job, launcher, extra_args) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            job = result.job
+            if result.returncode == 0:
+                manifest = manifests[job.project]
+                manifest.record(Manifest.key(job.scene, job.quality), job.digest)
+                manifest.save()
+            status = "ok" if result.returncode == 0 else "FAILED"
+            print(
+                f"[{status}] {result.job.name} in {result.elapsed:.1f}s"
+                f" (log: {os.path.relpath(result.job.log_file)})",
+                flush=True,
+            )
+            results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m toolkit.build")
+    parser.add_argument(
+        "projects",
+        nargs="*",
+        type=Path,
+        help=f"project directories (default: {' '.join(PROJECTS)})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of scenes rendered concurrently (default: cpu count)",
+    )
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITIES), default="k", help="render quality"
+    )
+    parser.add_argument(
+        "-s", "--scene", action="append", dest="scenes", help="only render this scene"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="render even if the output is up to date"
+    )
+    launchers = parser.add_mutually_exclusive_group()
+    launchers.add_argument(
+        "--daemon",
+        action="store_true",
+        help="render through the warm render server (python -m toolkit.daemon serve)",
+    )
+    launchers.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile every play/wait call into <project>/media/profiles",
+    )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="compile every Tex expression of the scenes on all cores first",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=parse_size,
+        default=DEFAULT_MAX_SIZE,
+        help=f"partial movie cache size bound (default: {DEFAULT_MAX_SIZE})",
+    )
+    args, extra_args = parser.parse_known_args(argv)
+
+    projects = [p.resolve() for p in args.projects] or [ROOT / p for p in PROJECTS]
+    jobs = collect_jobs(projects, args.scenes, args.quality)
+    manifests = {project: Manifest(project) for project in projects}
+    hash_jobs(jobs, extra_args)
+    if not args.force:
+        jobs = skip_fresh(jobs, manifests)
+    if not jobs:
+        print("Nothing to render.")
+        return 0
+
+    if args.prewarm:
+        # Imported here: the prewarm module itself imports this one.
+        from .prewarm import prewarm
+
+        pending = list(dict.fromkeys(job.project for job in jobs))
+        for error in prewarm(pending, args.jobs, [job.scene for job in jobs]):
+            print(f"[prewarm] {error}", file=sys.stderr)
+
+    cache = PartialMovieCache(projects, args.cache_size)
+    started = time.time()
+    start = time.perf_counter()
+    launcher = ["manim"]
+    if args.daemon:
+        launcher = [sys.executable, "-m", "toolkit.daemon", "render"]
+    elif args.profile:
+        launcher = [sys.executable, "-m", "toolkit.profiling", "--"]
+    results = build(jobs, args.jobs, launcher, extra_args, manifests)
+    failed = [r.job.name for r in results if r.returncode != 0]
+    print(
+        f"Rendered {len(results) - len(failed)}/{len(results)} scenes"
+        f" in {time.perf_counter() - start:.1f}s"
+    )
+    report(cache.stats(since=started))
+    removed, _ = cache.evict(keep_since=started)
+    if removed:
+        print(f"Evicted {removed} least recently used partial movie files")
+    if failed:
+        print(f"Failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""Size-bounded LRU cache of manim's partial movie files.
+
+manim names every partial movie file after the hash of the animation it
+encodes and reuses it when the same animation is played again. It also
+refreshes the access time of every file it concatenates into a scene, so the
+access time is a reliable recency signal even on `noatime` mounts.
+
+Usage: python -m toolkit.cache [--max-size SIZE] {stats,evict,clear} [PROJECT ...]
+"""
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+PARTIAL_MOVIE_GLOB = "media/videos/*/*/partial_movie_files/*/*"
+FILE_LIST = "partial_movie_file_list.txt"
+DEFAULT_MAX_SIZE = "20G"
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(text: str) -> int:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", text.upper())
+    if match is None:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+    return int(float(match[1]) * _UNITS[match[2]])
+
+
+def format_size(size: float) -> str:
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}TiB"
+
+
+@dataclass
+class Entry:
+    project: Path
+    path: Path
+    size: int
+    atime: float
+    mtime: float
+
+    @property
+    def scene(self) -> str:
+        # Qualified like `build.Job.name`: scene names repeat across projects.
+        return f"{self.project.name}:{self.path.parent.name}"
+
+
+@dataclass
+class Stats:
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return f"{self.hits} hits, {self.misses} misses ({ratio:.0%} hit rate)"
+
+
+class PartialMovieCache:
+    """The partial movie files of a set of projects, evicted as one pool."""
+
+    def __init__(self, projects: list[Path], max_size: int):
+        self.projects = projects
+        self.max_size = max_size
+
+    def entries(self) -> list[Entry]:
+        entries = []
+        for project in self.projects:
+            for path in project.glob(PARTIAL_MOVIE_GLOB):
+                if path.name == FILE_LIST or not path.is_file():
+                    continue
+                stat = path.stat()
+                entries.append(
+                    Entry(project, path, stat.st_size, stat.st_atime, stat.st_mtime)
+                )
+        return entries
+
+    def size(self) -> int:
+        return sum(entry.size for entry in self.entries())
+
+    def stats(self, since: float) -> dict[str, Stats]:
+        """Count the partial movies reused (hits) and written (misses) per scene
+        by the renders that started at `since`."""
+        stats: dict[str, Stats] = {}
+        for entry in self.entries():
+            if entry.mtime >= since:
+                stats.setdefault(entry.scene, Stats()).misses += 1
+            elif entry.atime >= since:
+                stats.setdefault(entry.scene, Stats()).hits += 1
+        return stats
+
+    def evict(self, keep_since: float | None = None) -> tuple[int, int]:
+        """Delete least recently used files until the cache fits in `max_size`.
+
+        Files used at or after `keep_since` belong to the current build and are
+        never evicted. Returns the number of files and bytes removed.
+        """
+        entries = sorted(self.entries(), key=lambda entry: entry.atime)
+        excess = sum(entry.size for entry in entries) - self.max_size
+        removed = freed = 0
+        for entry in entries:
+            if excess <= 0:
+                break
+            if keep_since is not None and entry.atime >= keep_since:
+                break
+            entry.path.unlink(missing_ok=True)
+            excess -= entry.size
+            freed += entry.size
+            removed += 1
+        return removed, freed
+
+    def clear(self) -> tuple[int, int]:
+        entries = self.entries()
+        for entry in entries:
+            entry.path.unlink(missing_ok=True)
+        return len(entries), sum(entry.size for entry in entries)
+
+
+def report(stats: dict[str, Stats]) -> None:
+    total = Stats()
+    for scene, scene_stats in sorted(stats.items()):
+        print(f"  {scene}: {scene_stats}")
+        total.hits += scene_stats.hits
+        total.misses += scene_stats.misses
+    print(f"Partial movie cache: {total}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    from .build import PROJECTS, ROOT
+
+    parser = argparse.ArgumentParser(prog="python -m toolkit.cache")
+    parser.add_argument("action", choices=["stats", "evict", "clear"])
+    parser.add_argument("projects", nargs="*", type=Path)
+    parser.add_argument(
+        "--max-size",
+        type=parse_size,
+        default=DEFAULT_MAX_SIZE,
+        help=f"cache size bound for evict (default: {DEFAULT_MAX_SIZE})",
+    )
+    args = parser.parse_args(argv)
+
+    projects = [p.resolve() for p in args.projects] or [ROOT / p for p in PROJECTS]
+    cache = PartialMovieCache(projects, args.max_size)
+    if args.action == "stats":
+        entries = cache.entries()
+        print(
+            f"{len(entries)} partial movie files,"
+            f" {format_size(sum(entry.size for entry in entries))}"
+        )
+        return 0
+    removed, freed = cache.evict() if args.action == "evict" else cache.clear()
+    print(f"Removed {removed} partial movie files ({format_size(freed)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
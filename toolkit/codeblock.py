@@ -0,0 +1,211 @@
+"""Syntax-highlighted code blocks whose geometry is cached on disk.
+
+Every `Code` highlights its source with Pygments, lays out a `Paragraph`
+character by character and colours each glyph by token, in every render
+process, for files that rarely change. `cached_code` keys a block by the
+source it shows and every option it was built with, stores the finished
+tree with `geometry.save` in the `code` media directory and loads it on
+later calls, in this process or any other.
+
+A loaded block is a `VGroup` of the same shape as the `Code` it replaces:
+`background_mobject`, the line numbers (or their placeholder) and `code`,
+whose submobjects are the lines and their characters, so `block.code[2]`,
+`Transform` and `FadeTransformPieces` work as before.
+
+`CodeDiff` turns one revision of a block into the next by a line diff of
+their sources: unchanged lines stay as they are (or only move), changed
+lines are transformed and the others fade in or out, so the work per frame
+grows with the size of the change rather than that of the file.
+
+Usage:
+    block = cached_code("hello_world.c", background="window", style="github-dark")
+    self.play(Write(block))
+    self.play(Indicate(block.code[2]))
+    self.play(CodeDiff(block, revised))
+"""
+
+import difflib
+import hashlib
+import inspect
+from pathlib import Path
+
+import manim as mm
+import manimpango
+import numpy as np
+
+from .geometry import FORMAT_VERSION, _manim_version, load, save
+
+
+def _source(file_name, code: str | None) -> str:
+    """The text `Code` would show, found the way `Code` finds its file."""
+    if file_name is None:
+        if code is None:
+            raise ValueError("Neither a code file nor a code string was given.")
+        return code
+    for path in (Path("assets", "codes", file_name), Path(file_name).expanduser()):
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+    raise FileNotFoundError(f"{file_name} not found in . or assets/codes")
+
+
+def code_key(source: str, **kwargs) -> str:
+    """A key for the block `Code` builds from `source` with `kwargs`.
+
+    `language` and `style` are among the options; when no language is given,
+    Pygments guesses it from the file name, which is then part of `kwargs`.
+    The glyph outlines also depend on the font `Code` falls back to and on
+    the ManimPango release that lays them out.
+    """
+    digest = hashlib.sha256()
+    options = dict(kwargs)
+    options.setdefault("font", inspect.signature(mm.Code).parameters["font"].default)
+    options = repr(sorted(options.items()))
+    versions = f"{_manim_version()}:{manimpango.__version__}"
+    digest.update(f"{FORMAT_VERSION}:{versions}:{options}".encode())
+    digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def _block(tree: mm.VMobject, source: str, insert_line_no: bool) -> mm.VGroup:
+    block = mm.VGroup(*tree.submobjects)
+    block.code_string = source
+    block.background_mobject, placeholder, block.code = block.submobjects
+    if insert_line_no:
+        block.line_numbers = placeholder
+    return block
+
+
+def cached_code(file_name=None, code: str | None = None, directory=None, **kwargs):
+    """A `Code` block, loaded from `directory` when it was built before.
+
+    Takes the arguments of `Code`. The default `directory` is `code` in the
+    media directory. A block that cannot be stored is returned as built.
+    """
+    source = _source(file_name, code)
+    options = dict(
+        kwargs, file_name=None if file_name is None else Path(file_name).name
+    )
+    root = Path(directory or mm.config.get_dir("media_dir") / "code")
+    path = root / f"{code_key(source, **options)}.npz"
+    insert_line_no = kwargs.get("insert_line_no", True)
+    try:
+        return _block(load(path), source, insert_line_no)
+    except (OSError, ValueError, KeyError):
+        pass
+    block = mm.Code(file_name, code, **kwargs)
+    try:
+        save(path, block)
+    except OSError:
+        return block
+    return _block(load(path), source, insert_line_no)
+
+
+def _lines(block) -> list[str]:
+    """The source line of every row of `block.code`."""
+    rows = len(block.code)
+    return (block.code_string.splitlines() + [""] * rows)[:rows]
+
+
+def _ink(line: str) -> str:
+    """The characters of `line` that have a glyph."""
+    return "".join(line.split())
+
+
+def _glyphs(row) -> list:
+    """The characters of `row` that are drawn.
+
+    `Code` lays its lines out without ligatures, which puts an empty
+    placeholder in a row for every space and indentation tab; unlike the
+    visible characters, these do not follow the source text one to one.
+    """
+    return [char for char in row if _is_drawn(char)]
+
+
+def _is_drawn(char) -> bool:
+    points = char.get_all_points()
+    return len(points) > 0 and bool(np.ptp(points, axis=0).any())
+
+
+class CodeDiff(mm.AnimationGroup):
+    """Turn the code block `source` into `target`, changing only what changed.
+
+    Both are `Code` or `cached_code` blocks; `source` must be in the scene
+    and is replaced by `target` when the animation ends. Lines are matched
+    with `difflib`; with `by_character`, replaced lines are matched glyph by
+    glyph as well, so only the characters that differ are faded. A line
+    whose glyphs do not match its source text is transformed as a whole,
+    with a warning.
+    """
+
+    def __init__(self, source, target, by_character: bool = False, **kwargs):
+        self.source, self.target = source, target
+        self.inserted = []
+        self.whole_lines = 0
+        animations = [
+            *self._move(source.background_mobject, target.background_mobject),
+            *self._move(source[1], target[1]),
+        ]
+        old, new = _lines(source), _lines(target)
+        matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            rows = list(zip(source.code[i1:i2], target.code[j1:j2]))
+            if tag == "equal":
+                for row, target_row in rows:
+                    animations += self._move(row, target_row)
+                continue
+            for i, j in zip(range(i1, i2), range(j1, j2)):
+                if by_character:
+                    animations += self._diff(
+                        source.code[i], target.code[j], _ink(old[i]), _ink(new[j])
+                    )
+                else:
+                    animations.append(mm.Transform(source.code[i], target.code[j]))
+            animations += self._fade(
+                source.code[i1 + len(rows) : i2], target.code[j1 + len(rows) : j2]
+            )
+        if self.whole_lines:
+            mm.logger.warning(
+                f"CodeDiff: {self.whole_lines} changed lines do not match their"
+                " glyphs and are transformed as a whole"
+            )
+        super().__init__(*animations, group=source, **kwargs)
+
+    @staticmethod
+    def _move(mobject, target) -> list[mm.Animation]:
+        points, target_points = mobject.get_all_points(), target.get_all_points()
+        if points.shape == target_points.shape and np.allclose(points, target_points):
+            return []
+        return [mm.Transform(mobject, target)]
+
+    def _fade(self, removed, inserted) -> list[mm.Animation]:
+        animations = []
+        for mobject in removed:
+            fade = mm.FadeOut(mobject)
+            # The whole source leaves the scene at the end; removing a part of
+            # it would split it up.
+            fade.remover = False
+            animations.append(fade)
+        for mobject in inserted:
+            animations.append(mm.FadeIn(mobject))
+            self.inserted.append(mobject)
+        return animations
+
+    def _diff(self, row, target_row, text, target_text) -> list[mm.Animation]:
+        glyphs, target_glyphs = _glyphs(row), _glyphs(target_row)
+        if len(glyphs) != len(text) or len(target_glyphs) != len(target_text):
+            self.whole_lines += 1
+            return [mm.Transform(row, target_row)]
+        animations = []
+        matcher = difflib.SequenceMatcher(None, text, target_text, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for char, target_char in zip(glyphs[i1:i2], target_glyphs[j1:j2]):
+                    animations += self._move(char, target_char)
+            else:
+                animations += self._fade(glyphs[i1:i2], target_glyphs[j1:j2])
+        return animations
+
+    def clean_up_from_scene(self, scene) -> None:
+        super().clean_up_from_scene(scene)
+        scene.remove(self.source, *self.inserted)
+        scene.add(self.target)
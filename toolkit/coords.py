@@ -0,0 +1,25 @@
+"""Vectorised mapping from axes coordinates to scene points.
+
+`Axes.c2p` works one axis at a time through each `NumberLine` and returns its
+result transposed when given arrays. For linearly scaled axes the mapping is
+affine, so it is computed once from three probe points and applied to every
+coordinate with a single matrix product.
+"""
+
+import manim as mm
+import numpy as np
+
+
+def _is_linear(axes) -> bool:
+    return all(isinstance(axis.scaling, mm.LinearBase) for axis in axes.get_axes())
+
+
+def coords_to_points(axes, *coords) -> np.ndarray:
+    """Map coordinate arrays `x, y[, z]` of `axes` to an (N, 3) array of points."""
+    coords = np.asarray(coords, dtype=float).reshape(len(coords), -1)
+    if not _is_linear(axes):
+        return np.asarray(axes.c2p(*coords), dtype=float).reshape(3, -1).T
+    dims = len(coords)
+    origin = np.asarray(axes.c2p(*np.zeros(dims)), dtype=float)
+    basis = np.array([axes.c2p(*unit) for unit in np.eye(dims)], dtype=float)
+    return origin + coords.T @ (basis - origin)
@@ -0,0 +1,147 @@
+"""A warm render server that replaces one-off `manim` processes.
+
+The server imports manim and the scientific stack once, initialises Pango,
+fontconfig and Cairo, and then serves render requests on a local socket. Every
+request is handled by a forked child, so it starts with all of that already
+loaded while scenes stay isolated from each other and can run concurrently.
+The Text SVG cache lives in each project's media directory and the Tex cache
+in the one both projects share; all children use them.
+
+Usage:
+    python -m toolkit.daemon serve
+    python -m toolkit.daemon render -qk main.py Regression   # like `manim ...`
+
+`render` falls back to running manim directly when no server is listening.
+"""
+
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+from pathlib import Path
+
+WARM_MODULES = ["numpy", "scipy.optimize", "sklearn.gaussian_process"]
+EXIT = b"\0"
+
+
+def socket_path() -> Path:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"manim-render-{os.getuid()}.sock"
+
+
+def warm_up() -> None:
+    import importlib
+
+    import manim
+
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    with tempfile.TemporaryDirectory() as media_dir:
+        with manim.tempconfig({"media_dir": media_dir}):
+            manim.Text("warm up")
+
+
+def _run_manim(argv: list[str]) -> int:
+    from manim import config
+    from manim.__main__ import main
+    from manim._config.utils import make_config_parser
+
+    # The config was read from the server's working directory at import;
+    # re-read it so the project's manim.cfg applies.
+    config.digest_parser(make_config_parser())
+    sys.argv = ["manim", *argv]
+    try:
+        main.main(args=argv, prog_name="manim", standalone_mode=False)
+    except SystemExit as error:
+        return error.code if isinstance(error.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _serve_request(connection: socket.socket) -> None:
+    request = json.loads(connection.makefile("rb").readline())
+    os.chdir(request["cwd"])
+    for fd in (1, 2):
+        os.dup2(connection.fileno(), fd)
+    returncode = _run_manim(request["argv"])
+    sys.stdout.flush()
+    sys.stderr.flush()
+    connection.sendall(EXIT + str(returncode).encode())
+    connection.close()
+
+
+def serve(path: Path) -> None:
+    warm_up()
+    path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+    # Children are reaped automatically; their exit status goes to the client.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"Render server listening on {path}", flush=True)
+    try:
+        while True:
+            connection, _ = server.accept()
+            if os.fork() == 0:
+                server.close()
+                # Rendering waits on LaTeX and ffmpeg subprocesses, whose exit
+                # status is lost while SIGCHLD is ignored.
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                try:
+                    _serve_request(connection)
+                finally:
+                    os._exit(0)
+            connection.close()
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def render(argv: list[str], path: Path) -> int:
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(path))
+    except OSError:
+        client.close()
+        os.execvp("manim", ["manim", *argv])
+
+    with client:
+        request = {"cwd": os.getcwd(), "argv": argv}
+        client.sendall(json.dumps(request).encode() + b"\n")
+        out = sys.stdout.buffer
+        done, tail = False, b""
+        while chunk := client.recv(1 << 16):
+            if not done:
+                output, separator, chunk = chunk.partition(EXIT)
+                out.write(output)
+                out.flush()
+                done = bool(separator)
+            tail += chunk
+    try:
+        return int(tail)
+    except ValueError:
+        # The child died before reporting back.
+        return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        serve(socket_path())
+        return 0
+    if argv[:1] == ["render"]:
+        return render(argv[1:], socket_path())
+    print(__doc__, file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Columns of CSV and NPY files as NumPy arrays, read in bounded memory.
+
+`load` returns the selected columns of a file as arrays. NPY files are
+memory-mapped, so a column of the right dtype is a view into the file and
+only the pages a scene touches are ever read. CSV files are parsed by
+`np.loadtxt` a chunk of rows at a time and only the selected columns are
+kept, so the text is never held in memory as a whole. `chunks` yields the
+same columns chunk by chunk instead, for scenes that stream their data into
+`RunningLinearFit`, `DotCloud.append` or `DensityMap.add`.
+
+Columns are selected by index or, for CSV files with a header row and NPY
+files of structured arrays, by name.
+
+Usage:
+    x, y = load("./assets/data.csv", columns=["x", "y"])
+    for x, y in chunks("./assets/big.npy", columns=[0, 1], dtype=np.float32):
+        fit.update(x, y)
+"""
+
+import itertools
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+
+CHUNK_ROWS = 1 << 16
+
+
+def _is_header(fields: list[str]) -> bool:
+    try:
+        for field in fields:
+            float(field)
+    except ValueError:
+        return True
+    return False
+
+
+def header(path, delimiter: str = ",") -> list[str]:
+    """Column names of `path`, or an empty list if it has none."""
+    path = Path(path)
+    if path.suffix == ".npy":
+        return list(np.load(path, mmap_mode="r").dtype.names or [])
+    with path.open(encoding="utf-8") as file:
+        fields = [field.strip() for field in file.readline().split(delimiter)]
+    return fields if _is_header(fields) else []
+
+
+def _indices(names: list[str], width: int, columns) -> list:
+    if columns is None:
+        return names or list(range(width))
+    indices = []
+    for column in columns:
+        if isinstance(column, str) and column not in names:
+            raise KeyError(f"no column {column!r}; the file has {names}")
+        indices.append(column)
+    return indices
+
+
+def _npy_columns(path: Path, columns, dtype) -> list[np.ndarray]:
+    array = np.load(path, mmap_mode="r")
+    names = list(array.dtype.names or [])
+    width = 1 if array.ndim == 1 else array.shape[1]
+    result = []
+    for column in _indices(names, width, columns):
+        if names:
+            values = array[column if isinstance(column, str) else names[column]]
+        else:
+            values = array if array.ndim == 1 else array[:, column]
+        # A view when the dtype already matches, a copy otherwise.
+        result.append(np.asarray(values, dtype=dtype))
+    return result
+
+
+def _csv_chunks(
+    path: Path, columns, dtype, delimiter: str, chunk_rows: int
+) -> Iterator[tuple[np.ndarray, ...]]:
+    with path.open(encoding="utf-8") as file:
+        first = file.readline()
+        fields = [field.strip() for field in first.split(delimiter)]
+        names = fields if _is_header(fields) else []
+        usecols = [
+            names.index(column) if isinstance(column, str) else column
+            for column in _indices(names, len(fields), columns)
+        ]
+        lines = file if names else itertools.chain([first], file)
+        while block := list(itertools.islice(lines, chunk_rows)):
+            values = np.loadtxt(
+                block, delimiter=delimiter, usecols=usecols, dtype=dtype, ndmin=2
+            )
+            yield tuple(values.T)
+
+
+def chunks(
+    path,
+    columns: Sequence | None = None,
+    dtype=np.float64,
+    delimiter: str = ",",
+    chunk_rows: int = CHUNK_ROWS,
+) -> Iterator[tuple[np.ndarray, ...]]:
+    """Yield the `columns` of `path` as arrays of at most `chunk_rows` rows."""
+    path = Path(path)
+    if path.suffix == ".npy":
+        data = _npy_columns(path, columns, None)
+        for start in range(0, len(data[0]), chunk_rows):
+            yield tuple(
+                np.asarray(column[start : start + chunk_rows], dtype=dtype)
+                for column in data
+            )
+    else:
+        yield from _csv_chunks(path, columns, dtype, delimiter, chunk_rows)
+
+
+def load(
+    path,
+    columns: Sequence | None = None,
+    dtype=np.float64,
+    delimiter: str = ",",
+    chunk_rows: int = CHUNK_ROWS,
+) -> tuple[np.ndarray, ...]:
+    """The `columns` of `path` (all by default), one array each."""
+    path = Path(path)
+    if path.suffix == ".npy":
+        return tuple(_npy_columns(path, columns, dtype))
+    parts = list(zip(*chunks(path, columns, dtype, delimiter, chunk_rows)))
+    if not parts:
+        width = len(columns) if columns is not None else len(header(path))
+        return tuple(np.empty(0, dtype=dtype) for _ in range(width))
+    return tuple(np.concatenate(part) for part in parts)
@@ -0,0 +1,92 @@
+"""Scatter plots drawn as a 2D histogram on the axes grid.
+
+Past a few ten thousand points individual dots stop being readable, and
+every one of them is still rasterised on every frame. A `DensityMap` bins the
+points into cells of the axes' coordinate grid instead and shows the counts
+as a single image, coloured through a colour map and scaled up with
+nearest-neighbour resampling so every cell stays a sharp square. Adding
+points only bins the new ones, so the map can follow a stream of millions of
+observations.
+
+Like the dots it replaces, the map is a mobject: cross-fade the two with
+`FadeOut(dots), FadeIn(density)`.
+
+Usage:
+    density = DensityMap.from_coords(number_plane, x, y)
+    self.play(mm.FadeOut(points), mm.FadeIn(density))
+    density.add(more_x, more_y)
+"""
+
+import manim as mm
+import numpy as np
+
+from .coords import coords_to_points
+
+
+class DensityMap(mm.ImageMobject):
+    """Counts of points in `cells_per_unit` x `cells_per_unit` cells per unit.
+
+    The cells cover the x and y ranges of `axes` (which should be linearly
+    scaled) and the image is fitted over them. Empty cells are transparent;
+    the others take their colour from `colors`, a gradient from the least to
+    the most populated cell, on a logarithmic scale if `log` is set.
+    """
+
+    def __init__(
+        self,
+        axes,
+        cells_per_unit: int = 8,
+        colors=(mm.BLUE_E, mm.BLUE, mm.YELLOW),
+        log: bool = True,
+        **kwargs,
+    ):
+        self.x_min, self.x_max = axes.x_range[:2]
+        self.y_min, self.y_max = axes.y_range[:2]
+        self.shape = (
+            round((self.y_max - self.y_min) * cells_per_unit),
+            round((self.x_max - self.x_min) * cells_per_unit),
+        )
+        self.counts = np.zeros(self.shape, dtype=np.int64)
+        self.colors = np.array([mm.color_to_rgb(color) for color in colors])
+        self.log = log
+        super().__init__(self._pixels(), **kwargs)
+        self.set_resampling_algorithm(mm.RESAMPLING_ALGORITHMS["nearest"])
+        corners = coords_to_points(
+            axes, [self.x_min, self.x_max], [self.y_min, self.y_max]
+        )
+        width, height, _ = corners[1] - corners[0]
+        self.stretch_to_fit_width(width).stretch_to_fit_height(height)
+        self.move_to(corners.mean(axis=0))
+
+    @classmethod
+    def from_coords(cls, axes, x, y, **kwargs) -> "DensityMap":
+        return cls(axes, **kwargs).add(x, y)
+
+    def add(self, x, y) -> "DensityMap":
+        """Bin the points `(x, y)`, given in axes coordinates, and redraw."""
+        rows, cols = self.shape
+        x = np.ravel(np.asarray(x, dtype=float))
+        y = np.ravel(np.asarray(y, dtype=float))
+        # Flat cell indices with one `bincount`, which is much cheaper than
+        # `np.histogram2d`'s search over arbitrary bin edges.
+        col = np.floor((x - self.x_min) / (self.x_max - self.x_min) * cols)
+        row = np.floor((y - self.y_min) / (self.y_max - self.y_min) * rows)
+        inside = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+        cells = row[inside].astype(np.int64) * cols + col[inside].astype(np.int64)
+        self.counts += np.bincount(cells, minlength=rows * cols).reshape(self.shape)
+        self.pixel_array = self._pixels()
+        return self
+
+    def _pixels(self) -> np.ndarray:
+        counts = self.counts.astype(float)
+        if self.log:
+            counts = np.log1p(counts)
+        level = counts / max(counts.max(), 1e-12)
+        stops = np.linspace(0, 1, len(self.colors))
+        rgb = np.stack(
+            [np.interp(level, stops, channel) for channel in self.colors.T], axis=-1
+        )
+        alpha = (self.counts > 0)[..., None].astype(float)
+        # Image rows run from the top, the y axis from the bottom.
+        pixels = np.concatenate([rgb, alpha], axis=-1)[::-1]
+        return np.round(pixels * 255).astype(np.uint8)
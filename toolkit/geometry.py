@@ -0,0 +1,151 @@
+"""Finished VMobject geometry stored on disk, and an SVG cache built on it.
+
+`save` writes a tree of VMobjects to an `.npz` file: the points of every
+node laid end to end, their offsets, each node's parent, and the fill and
+stroke colours and widths. `load` rebuilds the tree as plain VMobjects with
+a handful of array slices, without any of the work that produced it.
+
+manim parses the SVG behind every `Text`, `MathTex` and `SVGMobject` and
+converts its paths to Bézier curves in every process, even when the SVG
+itself came from its Tex or text cache; only repeats within one process are
+cached. `install_svg_cache` stores the submobjects of every parsed SVG with
+`save`, keyed by the SVG's contents, the mobject's `hash_seed` (class, file,
+style and path settings) and the manim version, and loads them on later
+runs instead of parsing again.
+
+Usage:
+    install_svg_cache()          # once, at the top of the scene module
+    save("shape.npz", mobject)
+    mobject = load("shape.npz")
+"""
+
+import hashlib
+import os
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+import manim as mm
+import numpy as np
+
+FORMAT_VERSION = 1
+_STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+
+
+def _nodes(mobject: mm.VMobject) -> tuple[list, list[int]]:
+    """The family of `mobject` depth first, with each node's parent index."""
+    nodes, parents = [], []
+    stack = [(mobject, -1)]
+    while stack:
+        node, parent = stack.pop()
+        parents.append(parent)
+        nodes.append(node)
+        stack.extend((child, len(nodes) - 1) for child in reversed(node.submobjects))
+    return nodes, parents
+
+
+def _offsets(arrays: list[np.ndarray]) -> np.ndarray:
+    return np.cumsum([0] + [len(array) for array in arrays])
+
+
+def save(path, mobject: mm.VMobject) -> None:
+    """Write `mobject` and its family to `path`, replacing it atomically."""
+    nodes, parents = _nodes(mobject)
+    arrays = {"parents": np.array(parents), "version": np.array(FORMAT_VERSION)}
+    for name in ("points", *_STYLE_ARRAYS):
+        values = [np.asarray(getattr(node, name)) for node in nodes]
+        arrays[name] = np.concatenate(values)
+        arrays[f"{name}_offsets"] = _offsets(values)
+    for name in ("stroke_width", "background_stroke_width"):
+        arrays[name] = np.array([getattr(node, name) for node in nodes], dtype=float)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Renders of other scenes may read the file while it is being written.
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, suffix=".npz", delete=False
+    ) as file:
+        try:
+            np.savez(file, **arrays)
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+    os.replace(file.name, path)
+
+
+def load(path) -> mm.VMobject:
+    """The VMobject tree `save` wrote to `path`.
+
+    Raises `ValueError` for files of another format version.
+    """
+    with np.load(path) as data:
+        if int(data["version"]) != FORMAT_VERSION:
+            raise ValueError(f"{path} has geometry format {int(data['version'])}")
+        arrays = {name: data[name] for name in data.files}
+    nodes = []
+    for index, parent in enumerate(arrays["parents"]):
+        node = mm.VMobject()
+        for name in ("points", *_STYLE_ARRAYS):
+            start, end = arrays[f"{name}_offsets"][index : index + 2]
+            setattr(node, name, arrays[name][start:end].copy())
+        node.stroke_width = arrays["stroke_width"][index]
+        node.background_stroke_width = arrays["background_stroke_width"][index]
+        if parent >= 0:
+            nodes[parent].submobjects.append(node)
+        nodes.append(node)
+    return nodes[0]
+
+
+def _manim_version() -> str:
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def svg_key(svg: mm.SVGMobject) -> str:
+    """A key for the geometry `svg` generates, stable across processes.
+
+    `hash_seed` names what manim's in-memory cache keys on, but that cache
+    hashes it with `hash()`, which differs between processes.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{FORMAT_VERSION}:{_manim_version()}:{svg.hash_seed!r}".encode())
+    digest.update(svg.get_file_path().read_bytes())
+    return digest.hexdigest()
+
+
+def install_svg_cache(directory=None) -> None:
+    """Cache the parsed geometry of every SVG-based mobject in `directory`.
+
+    The default is `geometry` in the media directory. `Text` turns manim's
+    in-process cache off by default; its geometry is cached on disk all the
+    same, since the key covers everything the SVG contains.
+    """
+    from manim.mobject.svg import svg_mobject
+    from manim.utils.iterables import hash_obj
+
+    parse = svg_mobject.SVGMobject.init_svg_mobject
+    if getattr(parse, "cached_on_disk", False):
+        return
+
+    def init_svg_mobject(self, use_svg_cache: bool) -> None:
+        memory = svg_mobject.SVG_HASH_TO_MOB_MAP
+        if use_svg_cache and hash_obj(self.hash_seed) in memory:
+            return parse(self, use_svg_cache)
+        root = Path(directory or mm.config.get_dir("media_dir") / "geometry")
+        path = root / f"{svg_key(self)}.npz"
+        try:
+            self.add(*load(path).submobjects)
+        except (OSError, ValueError, KeyError):
+            parse(self, use_svg_cache)
+            try:
+                save(path, mm.VMobject().add(*self.submobjects))
+            except OSError:  # a read-only or full media directory
+                pass
+            return
+        if use_svg_cache:
+            memory[hash_obj(self.hash_seed)] = self.copy()
+
+    init_svg_mobject.cached_on_disk = True
+    svg_mobject.SVGMobject.init_svg_mobject = init_svg_mobject
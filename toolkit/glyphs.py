@@ -0,0 +1,170 @@
+"""Monospace text over a small alphabet, drawn by instancing cached glyphs.
+
+A `Paragraph` of random bits lays out and parses every character on its own,
+so thousands of bits cost thousands of glyph paths, and changing them means
+building a new paragraph. A `GlyphGrid` lays out its alphabet once, pads
+every glyph outline to the same number of curves and places copies of them
+on a grid of character cells. The points of a row are
+`templates[codes] + cells`, so setting new characters is one fancy-indexing
+operation, and grids of the same shape transform into each other glyph by
+glyph.
+
+Usage:
+    bits = GlyphGrid(*["01101001", "11010010"], alphabet="01", color=YELLOW)
+    bits.set_codes(np.random.randint(0, 2, (2, 8)))
+"""
+
+from functools import lru_cache
+
+import manim as mm
+import numpy as np
+
+
+@lru_cache(maxsize=16)
+def _glyphs(
+    alphabet: str, font: str, font_size: float, line_spacing: float
+) -> tuple[np.ndarray, float, float]:
+    """Glyph outlines of `alphabet` with the cell advance and line pitch.
+
+    The outlines are relative to their cell and all have the same number of
+    points; characters without outline (spaces) collapse to the cell origin.
+    """
+    inked = [char for char in alphabet if not char.isspace()]
+    n = len(inked)
+    # Two copies on the first line give the advance of a cell, the copy on
+    # the second line (after the newline's placeholder) the distance between
+    # lines. Without ligatures every character keeps a glyph of its own.
+    sample = "".join(inked)
+    text = mm.Text(
+        f"{sample}{sample}\n{sample}",
+        font=font,
+        font_size=font_size,
+        line_spacing=line_spacing,
+        disable_ligatures=True,
+    )
+    chars = text.chars if n else []
+    advance = (chars[n].get_x() - chars[0].get_x()) / n if n else 0.0
+    pitch = chars[0].get_y() - chars[2 * n + 1].get_y() if n else 0.0
+    origin = chars[0].get_center() if n else np.zeros(3)
+    curves = max((len(char.points) for char in chars[:n]), default=0)
+    curves //= mm.VMobject().n_points_per_cubic_curve
+
+    outlines = {}
+    for i, char in enumerate(inked):
+        glyph = mm.VMobject().set_points(chars[i].points)
+        glyph.insert_n_curves(curves - glyph.get_num_curves())
+        outlines[char] = glyph.points - origin - i * advance * mm.RIGHT
+    shape = (curves * mm.VMobject().n_points_per_cubic_curve, 3)
+    templates = np.array([outlines.get(char, np.zeros(shape)) for char in alphabet])
+    templates.setflags(write=False)
+    return templates, advance, pitch
+
+
+def _bounds(arrays: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray] | None:
+    points = np.concatenate(arrays) if arrays else np.zeros((0, 3))
+    if not len(points):
+        return None
+    # Column by column: reducing an (N, 3) array along axis 0 is ten times
+    # slower.
+    columns = points.T
+    return (
+        np.array([column.min() for column in columns]),
+        np.array([column.max() for column in columns]),
+    )
+
+
+class GlyphGrid(mm.VGroup):
+    """Rows of monospace text, one VMobject per row, like `Paragraph`.
+
+    `alphabet` lists every character the grid may ever show; it defaults to
+    the characters of `rows`. Rows are aligned like `Paragraph` lines, and
+    indexing the grid gives its rows.
+    """
+
+    def __init__(
+        self,
+        *rows: str,
+        alphabet: str | None = None,
+        alignment: str = "left",
+        font: str = "",
+        font_size: float = mm.DEFAULT_FONT_SIZE,
+        line_spacing: float = -1,
+        color=mm.WHITE,
+        fill_opacity: float = 1.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.alphabet = "".join(sorted(set(alphabet or "".join(rows))))
+        self.alignment = alignment
+        self.templates, self.advance, self.pitch = _glyphs(
+            self.alphabet, font, font_size, line_spacing
+        )
+        self._lookup = np.array([ord(char) for char in self.alphabet])
+        self._layout_bounds = None
+        self.add(
+            *[
+                mm.VMobject(fill_color=color, fill_opacity=fill_opacity, stroke_width=0)
+                for _ in rows
+            ]
+        )
+        self.set_codes([self.encode(row) for row in rows])
+
+    def encode(self, row: str) -> np.ndarray:
+        """Indices into the alphabet of the characters of `row`."""
+        points = np.frombuffer(row.encode("utf-32-le"), dtype=np.uint32)
+        codes = np.searchsorted(self._lookup, points)
+        codes = np.minimum(codes, len(self._lookup) - 1)
+        if np.any(self._lookup[codes] != points):
+            raise ValueError(f"{row!r} has characters outside {self.alphabet!r}")
+        return codes
+
+    def set_rows(self, *rows: str) -> "GlyphGrid":
+        return self.set_codes([self.encode(row) for row in rows])
+
+    def _layout(self, codes) -> list[np.ndarray]:
+        """Points of every row with cell (0, 0) of an unscaled grid at the origin."""
+        widths = np.array([len(row) for row in codes])
+        offsets = (widths.max(initial=0) - widths) * self.advance
+        offsets *= {"left": 0.0, "center": 0.5, "right": 1.0}[self.alignment]
+        if isinstance(codes, np.ndarray) and codes.ndim == 2:
+            cells = (
+                np.arange(codes.shape[1])[None, :, None] * self.advance * mm.RIGHT
+                + offsets[:, None, None] * mm.RIGHT
+                - np.arange(len(codes))[:, None, None] * self.pitch * mm.UP
+            )
+            points = self.templates[codes] + cells[:, :, None]
+            return list(points.reshape(len(codes), -1, 3))
+        layout = []
+        for i, row in enumerate(codes):
+            columns = np.arange(len(row)) * self.advance + offsets[i]
+            cells = columns[:, None] * mm.RIGHT - i * self.pitch * mm.UP
+            layout.append((self.templates[row] + cells[:, None]).reshape(-1, 3))
+        return layout
+
+    def set_codes(self, codes) -> "GlyphGrid":
+        """Show the characters `alphabet[codes[i][j]]` in place.
+
+        `codes` is a (rows, columns) integer array, which is laid out in a
+        single vectorised step, or a list of one array per row. The new
+        characters keep the shift and scale the grid has been given since
+        it was created (but not rotations).
+        """
+        layout = self._layout(codes)
+        bounds = _bounds(layout)
+        drawn = _bounds([row.points for row in self.submobjects])
+        scale, shift = np.ones(3), np.zeros(3)
+        if self._layout_bounds is None:
+            if bounds is not None:
+                shift = -(bounds[0] + bounds[1]) / 2
+        elif drawn is not None:
+            # Map the old layout's bounding box onto where the grid is now.
+            extent = self._layout_bounds[1] - self._layout_bounds[0]
+            scale = np.divide(
+                drawn[1] - drawn[0], extent, out=np.ones(3), where=extent > 0
+            )
+            shift = drawn[0] - self._layout_bounds[0] * scale
+        for row, row_points in zip(self.submobjects, layout):
+            row.points = row_points * scale + shift
+        self._layout_bounds = bounds
+        self.codes = codes
+        return self
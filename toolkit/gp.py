@@ -0,0 +1,226 @@
+"""Gaussian process regression curves.
+
+A `GPCurve` draws the posterior mean of a fitted regressor together with a
+band of `z` standard deviations around it. Both come from a single
+`predict(grid, return_std=True)` call on the plot's sample grid. Predictions
+are cached by training set and kernel, so redrawing a stage costs nothing.
+
+Any object with scikit-learn's `GaussianProcessRegressor` interface works,
+including `OnlineGP`, which adds observations one at a time by extending its
+Cholesky factor instead of refitting. scikit-learn and SciPy are only
+imported by the code that uses them.
+
+Usage:
+    gpr = refit(gpr, x[:2], y[:2])
+    curve = GPCurve(axes, gpr, color=mm.WHITE)
+
+    gp = OnlineGP(1 * RBF())
+    for x, y in stream:
+        gp.add(x, y)
+        curve.become(GPCurve(axes, gp))
+"""
+
+from collections import OrderedDict
+
+import manim as mm
+import numpy as np
+
+from .coords import coords_to_points
+from .plotting import VectorizedGraph, plot_range, sample_grid
+
+_PREDICTIONS: OrderedDict = OrderedDict()
+_MAX_PREDICTIONS = 32
+
+
+def _kernel_key(kernel) -> tuple:
+    # A kernel's repr rounds its hyperparameters to three digits; `theta`
+    # and the float parameters hold them exactly.
+    params = repr(sorted(kernel.get_params().items()))
+    return (type(kernel).__name__, params, np.asarray(kernel.theta).tobytes())
+
+
+def _training_key(gpr) -> tuple:
+    settings = (
+        np.asarray(gpr.alpha, dtype=float).tobytes(),
+        bool(getattr(gpr, "normalize_y", False)),
+    )
+    if not hasattr(gpr, "X_train_"):
+        return ("prior", _kernel_key(gpr.kernel), settings)
+    return (
+        np.asarray(gpr.X_train_).tobytes(),
+        np.asarray(gpr.y_train_).tobytes(),
+        _kernel_key(gpr.kernel_),
+        settings,
+    )
+
+
+def predict(gpr, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Posterior mean and standard deviation of `gpr` at every element of `x`."""
+    x = np.asarray(x, dtype=float)
+    key = (_training_key(gpr), x.tobytes())
+    if key in _PREDICTIONS:
+        _PREDICTIONS.move_to_end(key)
+    else:
+        mean, std = gpr.predict(x.reshape(-1, 1), return_std=True)
+        _PREDICTIONS[key] = (mean.reshape(x.shape), std.reshape(x.shape))
+        if len(_PREDICTIONS) > _MAX_PREDICTIONS:
+            _PREDICTIONS.popitem(last=False)
+    return _PREDICTIONS[key]
+
+
+def refit(gpr, x, y):
+    """Fit `gpr` to `(x, y)`, starting the kernel search from its last fit.
+
+    This saves most of the optimiser's iterations when points are added one
+    at a time. The search may settle in a different local optimum than a fit
+    from the initial kernel would.
+    """
+    if hasattr(gpr, "kernel_"):
+        gpr.set_params(kernel=gpr.kernel_)
+    return gpr.fit(np.reshape(x, (-1, 1)), np.reshape(y, (-1, 1)))
+
+
+class OnlineGP:
+    """Exact GP regression on scalar inputs that grows one observation at a time.
+
+    Adding a point extends the Cholesky factor of `K + alpha * I` by one row,
+    in O(n²), with the hyperparameters of `kernel` held fixed. With
+    `reoptimize_every=k`, every k-th point refits the hyperparameters with
+    scikit-learn, starting from `kernel` like `GaussianProcessRegressor.fit`
+    does, and takes its factor. `predict` matches `GaussianProcessRegressor`.
+    """
+
+    def __init__(self, kernel, alpha: float = 1e-10, reoptimize_every=None, **params):
+        self.kernel = kernel
+        self.kernel_ = kernel
+        self.alpha = alpha
+        self.reoptimize_every = reoptimize_every
+        self.params = params
+        self.n = 0
+        self._x = np.empty(16)
+        self._y = np.empty(16)
+        # The factor lives in the leading n x n block of a buffer that is the
+        # identity elsewhere; see `_solve`.
+        self._L = np.eye(16)
+        self._weights = None
+
+    @property
+    def X_train_(self) -> np.ndarray:
+        return self._x[: self.n, None]
+
+    @property
+    def y_train_(self) -> np.ndarray:
+        return self._y[: self.n]
+
+    @property
+    def L_(self) -> np.ndarray:
+        return self._L[: self.n, : self.n]
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._x)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        L = np.eye(capacity)
+        L[: self.n, : self.n] = self.L_
+        self._L = L
+        self._x = np.resize(self._x, capacity)
+        self._y = np.resize(self._y, capacity)
+
+    def _solve(self, b: np.ndarray, trans: int = 0) -> np.ndarray:
+        """Solve `L_ @ x = b` (or `L_.T @ x = b` with `trans=1`).
+
+        LAPACK would copy the non-contiguous n x n block on every call, which
+        costs more than the solve itself. The whole buffer is contiguous and
+        triangular, and because it is the identity past row n the first n
+        entries of its solution are the solution for the block.
+        """
+        from scipy.linalg import solve_triangular
+
+        padded = np.zeros((len(self._L),) + b.shape[1:])
+        padded[: self.n] = b
+        solution = solve_triangular(
+            self._L, padded, trans=trans, lower=True, check_finite=False
+        )
+        return solution[: self.n]
+
+    def add(self, x, y) -> "OnlineGP":
+        """Observe `y` at `x` (scalars or equally long arrays)."""
+        for xi, yi in zip(np.ravel(x), np.ravel(y)):
+            self._reserve(self.n + 1)
+            point = np.array([[xi]], dtype=float)
+            row = self._solve(self.kernel_(self.X_train_, point)[:, 0])
+            pivot = self.kernel_.diag(point)[0] + self.alpha - row @ row
+            if pivot <= 0:
+                raise np.linalg.LinAlgError(
+                    f"kernel matrix is not positive definite at x={xi}; "
+                    "increase alpha"
+                )
+            self._L[self.n, : self.n] = row
+            self._L[self.n, self.n] = np.sqrt(pivot)
+            self._x[self.n] = xi
+            self._y[self.n] = yi
+            self.n += 1
+            if self.reoptimize_every and self.n % self.reoptimize_every == 0:
+                self._reoptimize()
+        self._weights = None
+        return self
+
+    def _reoptimize(self) -> None:
+        from sklearn.gaussian_process import GaussianProcessRegressor
+
+        gpr = GaussianProcessRegressor(self.kernel, alpha=self.alpha, **self.params)
+        gpr.fit(self.X_train_, self.y_train_)
+        self.kernel_ = gpr.kernel_
+        self._L[: self.n, : self.n] = gpr.L_
+
+    def predict(self, X, return_std: bool = False):
+        X = np.asarray(X, dtype=float).reshape(-1, 1)
+        if self.n == 0:
+            mean = np.zeros(len(X))
+            std = np.sqrt(self.kernel_.diag(X))
+            return (mean, std) if return_std else mean
+        if self._weights is None:
+            self._weights = self._solve(self._solve(self.y_train_), trans=1)
+        K = self.kernel_(X, self.X_train_)
+        mean = K @ self._weights
+        if not return_std:
+            return mean
+        v = self._solve(K.T)
+        variance = self.kernel_.diag(X) - np.einsum("ij,ij->j", v, v)
+        return mean, np.sqrt(np.clip(variance, 0, None))
+
+
+class GPCurve(mm.VGroup):
+    """Posterior mean of `gpr` over `axes` with a band of `z` standard deviations.
+
+    `band` is drawn below `mean`; pass `z=0` to draw the mean alone.
+    """
+
+    def __init__(
+        self,
+        axes,
+        gpr,
+        x_range=None,
+        z: float = 2.0,
+        color=mm.WHITE,
+        band_opacity: float = 0.25,
+        **kwargs,
+    ):
+        t = sample_grid(*plot_range(axes, x_range), axes.x_axis.scaling)
+        mean, std = predict(gpr, t)
+        self.mean = VectorizedGraph(
+            axes,
+            lambda x: predict(gpr, x)[0],
+            x_range,
+            vectorized=True,
+            color=color,
+            **kwargs,
+        )
+        upper = coords_to_points(axes, t, mean + z * std)
+        lower = coords_to_points(axes, t, mean - z * std)
+        self.band = mm.VMobject(
+            fill_color=color, fill_opacity=band_opacity if z else 0, stroke_width=0
+        ).set_points_as_corners(np.concatenate([upper, lower[::-1], upper[:1]]))
+        super().__init__(self.band, self.mean)
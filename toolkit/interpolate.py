@@ -0,0 +1,56 @@
+"""Polynomial interpolation in barycentric form.
+
+The weights are computed once in O(n²); every evaluation after that is
+O(n) per point and works on whole arrays, so an interpolant through hundreds
+of nodes plots as fast as a closed-form function.
+
+Usage:
+    f = BarycentricInterpolant(xx, func(xx))
+    f = BarycentricInterpolant.chebyshev(func, 200, -2, 2)
+    y = f(np.linspace(-2, 2, 1000))
+"""
+
+import numpy as np
+
+
+class BarycentricInterpolant:
+    """The polynomial of lowest degree through `(nodes[i], values[i])`."""
+
+    def __init__(self, nodes, values, weights=None):
+        self.nodes = np.asarray(nodes, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        if len(np.unique(self.nodes)) != len(self.nodes):
+            raise ValueError("interpolation nodes must be distinct")
+        self.weights = _weights(self.nodes) if weights is None else weights
+
+    @classmethod
+    def chebyshev(cls, func, n: int, a: float, b: float) -> "BarycentricInterpolant":
+        """Interpolate `func` at `n` Chebyshev points of the second kind."""
+        j = np.arange(n)
+        nodes = (a + b) / 2 + (b - a) / 2 * np.cos(np.pi * j / max(n - 1, 1))
+        # Closed-form weights for these nodes, already scaled to order one.
+        weights = (-1.0) ** j
+        weights[[0, -1]] /= 2
+        return cls(nodes, func(nodes), weights)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        diff = x.reshape(-1, 1) - self.nodes
+        exact = diff == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = self.weights / diff
+            y = (terms * self.values).sum(axis=1) / terms.sum(axis=1)
+        # At a node the formula is 0/0 (or inf/inf); the value is known.
+        rows, cols = np.nonzero(exact)
+        y[rows] = self.values[cols]
+        return y.reshape(x.shape) if x.ndim else y[0]
+
+
+def _weights(nodes: np.ndarray) -> np.ndarray:
+    diff = nodes[:, None] - nodes
+    np.fill_diagonal(diff, 1)
+    # Products of hundreds of differences overflow, so sum logarithms and
+    # rescale; the barycentric formula is invariant to a common factor.
+    log = -np.log(np.abs(diff)).sum(axis=1)
+    sign = np.prod(np.sign(diff), axis=1)
+    return sign * np.exp(log - log.max())
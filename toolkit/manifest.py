@@ -0,0 +1,121 @@
+"""Content hashes of scenes, used to skip renders whose inputs did not change.
+
+A scene's hash covers the source of its class and of the scene classes it
+derives from in the same module, the module-level code it shares with the
+other scenes (imports, seeds, helpers), every project file it names in a
+string literal, the `toolkit` modules the scenes import, the project's
+`manim.cfg`, the manim version and the render flags.
+"""
+
+import ast
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+
+from .scenes import SceneIndex
+
+MANIFEST = Path("media") / "build-manifest.json"
+CONFIG = "manim.cfg"
+PACKAGE = Path(__file__).resolve().parent
+
+
+def _manim_version() -> str:
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _hash_file(digest, path: Path) -> None:
+    digest.update(str(path.name).encode())
+    digest.update(path.read_bytes())
+
+
+def _toolkit_modules(source: str, found: set[Path] | None = None) -> set[Path]:
+    """The toolkit source files `source` imports, directly or through others."""
+    found = set() if found is None else found
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                names = [node.module] if node.module else []
+            elif node.module and node.module.startswith(f"{PACKAGE.name}."):
+                names = [node.module.partition(".")[2]]
+            else:
+                continue
+        elif isinstance(node, ast.Import):
+            names = [
+                alias.name.partition(".")[2]
+                for alias in node.names
+                if alias.name.startswith(f"{PACKAGE.name}.")
+            ]
+        else:
+            continue
+        for name in names:
+            path = PACKAGE.joinpath(*name.split(".")).with_suffix(".py")
+            if path.is_file() and path not in found:
+                found.add(path)
+                _toolkit_modules(path.read_text(encoding="utf-8"), found)
+    return found
+
+
+def _lineage(index: SceneIndex, name: str) -> list[str]:
+    """`name` and the scenes of the module it derives from, directly or not."""
+    lineage, pending = [], [name]
+    while pending:
+        scene = pending.pop()
+        if scene not in lineage:
+            lineage.append(scene)
+            pending.extend(reversed(index.scenes[scene].bases))
+    return lineage
+
+
+def scene_hashes(project: Path, flags: list[str]) -> dict[str, str]:
+    """Return the content hash of every scene of `project`."""
+    index = SceneIndex.load(project)
+
+    shared = hashlib.sha256()
+    shared.update(index.preamble.encode())
+    shared.update(_manim_version().encode())
+    shared.update(" ".join(flags).encode())
+    if (project / CONFIG).is_file():
+        _hash_file(shared, project / CONFIG)
+    for path in sorted(_toolkit_modules(index.preamble)):
+        _hash_file(shared, path)
+
+    hashes = {}
+    for name, info in index.scenes.items():
+        digest = shared.copy()
+        for base in _lineage(index, name):
+            digest.update(index.scenes[base].source.encode())
+        for path in info.assets:
+            _hash_file(digest, path)
+        hashes[name] = digest.hexdigest()
+    return hashes
+
+
+class Manifest:
+    """Per-project record of the hash each rendered output was built from."""
+
+    def __init__(self, project: Path):
+        self.path = project / MANIFEST
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    @staticmethod
+    def key(scene: str, quality: str) -> str:
+        return f"{scene}@{quality}"
+
+    def is_fresh(self, key: str, digest: str, output: Path) -> bool:
+        return self.entries.get(key) == digest and output.is_file()
+
+    def record(self, key: str, digest: str) -> None:
+        self.entries[key] = digest
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+        tmp.replace(self.path)
@@ -0,0 +1,164 @@
+"""Function graphs sampled with one call on the whole sample grid.
+
+`Axes.plot` calls the function once per sample and maps every sample through
+`Axes.c2p` on its own, then adds and smooths the curves one at a time. `plot`
+evaluates the function on the full grid when it accepts arrays, maps the grid
+with `coords_to_points`, reuses the grid of every axes range it has sampled
+before and computes all the handles in one pass. The result is a regular
+`ParametricFunction` with the same points, so it animates exactly like the
+graphs `Axes.plot` returns.
+
+`TrackedGraph` is a graph of a function of `ValueTracker`s that follows them
+by rewriting its own points, instead of `become`-ing a freshly plotted graph
+on every frame.
+
+Usage:
+    graph = plot(axes, lambda x: a * x + b, color=mm.WHITE)
+    graph = TrackedGraph(axes, lambda x, a, b: a * x + b, [tracker_a, tracker_b])
+"""
+
+from functools import lru_cache
+
+import manim as mm
+import numpy as np
+
+from .coords import coords_to_points
+
+try:
+    from manim.utils.bezier import get_smooth_handle_points as smooth_handles
+except ImportError:  # renamed in manim 0.19
+    from manim.utils.bezier import (
+        get_smooth_cubic_bezier_handle_points as smooth_handles,
+    )
+
+
+@lru_cache(maxsize=64)
+def sample_grid(t_min: float, t_max: float, t_step: float, scaling) -> np.ndarray:
+    """The sample inputs `ParametricFunction` uses for this range (read only)."""
+    grid = np.append(
+        scaling.function(np.arange(t_min, t_max, t_step)), scaling.function(t_max)
+    )
+    grid.setflags(write=False)
+    return grid
+
+
+def smooth_curves(anchors: np.ndarray, smooth: bool = True) -> np.ndarray:
+    """Control points, shaped (k - 1, 4, 3), of one path through k `anchors`."""
+    if smooth:
+        h1, h2 = smooth_handles(anchors)
+    else:
+        h1 = mm.interpolate(anchors[:-1], anchors[1:], 1 / 3)
+        h2 = mm.interpolate(anchors[:-1], anchors[1:], 2 / 3)
+    return np.stack([anchors[:-1], h1, h2, anchors[1:]], axis=1)
+
+
+def plot_range(axes, x_range=None) -> np.ndarray:
+    """`[t_min, t_max, t_step]` of `axes.plot(f, x_range)`, sampling the ticks."""
+    t_range = np.array(axes.x_range, dtype=float)
+    if x_range is not None:
+        t_range[: len(x_range)] = x_range
+    if x_range is None or len(x_range) < 3:
+        t_range[2] /= axes.num_sampled_graph_points_per_tick
+    return t_range
+
+
+def evaluate(function, t: np.ndarray, vectorized: bool | None = None) -> np.ndarray:
+    """`function` at every element of `t`, in a single call where possible.
+
+    With `vectorized=None` the function is tried on the whole array and used
+    per element if that raises or does not return one value per input (a
+    function of scalars may reduce over the array instead). `True` trusts the
+    array call and broadcasts constants; `False` always calls per element.
+    """
+    if vectorized is not False:
+        try:
+            y = np.asarray(function(t), dtype=float)
+        except (TypeError, ValueError):
+            if vectorized:
+                raise
+        else:
+            if y.shape == t.shape:
+                return y
+            if vectorized:
+                return np.broadcast_to(y, t.shape)
+    return np.array([function(x) for x in t], dtype=float)
+
+
+class VectorizedGraph(mm.ParametricFunction):
+    """Graph of `function` over `axes`, sampled like `axes.plot(function)`."""
+
+    def __init__(self, axes, function, x_range=None, vectorized=None, **kwargs):
+        # Like the trackers of `TrackedGraph`, the axes live in a closure:
+        # an attribute would be deep-copied with every copy of the graph, and
+        # the copies would sample against a stale copy of the axes.
+        def to_points(t: np.ndarray, y: np.ndarray) -> np.ndarray:
+            return coords_to_points(axes, t, y)
+
+        self._coords_to_points = to_points
+        self.underlying_function = function
+        self.vectorized = vectorized
+        super().__init__(
+            lambda t: axes.c2p(t, function(t)),
+            t_range=plot_range(axes, x_range),
+            scaling=axes.x_axis.scaling,
+            **kwargs,
+        )
+
+    def sample(self) -> tuple[np.ndarray, np.ndarray]:
+        """The sample inputs and their scene points."""
+        t = sample_grid(self.t_min, self.t_max, self.t_step, self.scaling)
+        y = evaluate(self.underlying_function, t, self.vectorized)
+        return t, self._coords_to_points(t, y)
+
+    def set_anchors(self, anchors: np.ndarray) -> "VectorizedGraph":
+        """Make the graph one path through `anchors`, smoothed if configured."""
+        points = smooth_curves(anchors, self.use_smoothing).reshape(-1, 3)
+        if self.points.shape == points.shape:
+            self.points[:] = points
+        else:
+            self.set_points(points)
+        return self
+
+    def generate_points(self):
+        if self.discontinuities is not None:
+            return super().generate_points()
+        _, points = self.sample()
+        return self.set_anchors(points)
+
+
+class TrackedGraph(VectorizedGraph):
+    """Graph of `function(x, *values)` for the current values of `trackers`.
+
+    An updater resamples the graph in place whenever one of the values changed
+    since it was last drawn, and does nothing otherwise.
+    """
+
+    def __init__(
+        self, axes, function, trackers, x_range=None, vectorized=None, **kwargs
+    ):
+        trackers = tuple(trackers)
+
+        # The trackers live in closures rather than attributes: animations
+        # deep-copy the graph, and the copies must follow the same trackers.
+        def values():
+            return tuple(tracker.get_value() for tracker in trackers)
+
+        self._tracked_values = values
+        super().__init__(
+            axes, lambda x: function(x, *values()), x_range, vectorized, **kwargs
+        )
+        self._drawn_values = values()
+        self.add_updater(TrackedGraph._follow_trackers)
+
+    def _follow_trackers(self) -> None:
+        values = self._tracked_values()
+        if values == self._drawn_values:
+            return
+        self._drawn_values = values
+        _, anchors = self.sample()
+        self.set_anchors(anchors)
+
+
+def plot(axes, function, x_range=None, vectorized=None, **kwargs) -> VectorizedGraph:
+    """Drop-in replacement for `axes.plot(function, x_range, **kwargs)`."""
+    return VectorizedGraph(axes, function, x_range, vectorized, **kwargs)
@@ -0,0 +1,112 @@
+"""Compile the LaTeX of every scene before any of them is rendered.
+
+manim names each compiled `MathTex`/`Tex` expression after a hash of its
+LaTeX source and reuses the SVG whenever that file already exists. Both
+projects point `tex_dir` at `.tex-cache` in the repository root, so an
+expression compiled once serves every scene of every project and every
+render process.
+This command takes the constant expressions from the scene index and builds
+them on a pool of processes, leaving LaTeX off the critical path of the
+renders that follow. It also builds the digits `DecimalNumber` and
+`Integer` draw.
+
+Usage: python -m toolkit.prewarm [-j JOBS] [-s SCENE] [PROJECT ...]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .build import PROJECTS, ROOT
+from .scenes import SceneIndex
+
+NUMBER_GLYPHS = [("MathTex", (char,)) for char in "0123456789.-"]
+
+
+def collect(project: Path, scenes: list[str] | None = None) -> list:
+    """The distinct `(class name, strings)` expressions of `project`'s scenes."""
+    expressions = dict.fromkeys(NUMBER_GLYPHS)
+    for name, info in SceneIndex.load(project).scenes.items():
+        if not scenes or name in scenes:
+            expressions.update(dict.fromkeys(info.tex))
+    return list(expressions)
+
+
+def _init(project: Path) -> None:
+    os.chdir(project)
+    from manim import config
+    from manim._config.utils import make_config_parser
+
+    # Pick up the project's manim.cfg, and with it the shared `tex_dir`.
+    config.digest_parser(make_config_parser())
+    # manim creates it on first use, which races between the workers.
+    config.get_dir("tex_dir").mkdir(parents=True, exist_ok=True)
+
+
+def _compile(expression) -> str | None:
+    import manim
+
+    kind, strings = expression
+    try:
+        getattr(manim, kind)(*strings)
+    except Exception as error:  # a broken expression fails its scene later
+        return f"{kind}{strings!r}: {error}"
+    return None
+
+
+def prewarm(
+    projects: list[Path], workers: int, scenes: list[str] | None = None
+) -> list[str]:
+    """Compile the expressions of `projects`; return the errors."""
+    errors = []
+    for project in projects:
+        expressions = collect(project, scenes)
+        start = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(workers, len(expressions))),
+            initializer=_init,
+            initargs=(project,),
+        ) as pool:
+            failed = [e for e in pool.map(_compile, expressions) if e]
+        print(
+            f"[prewarm] {project.name}: {len(expressions) - len(failed)}"
+            f"/{len(expressions)} Tex expressions"
+            f" in {time.perf_counter() - start:.1f}s",
+            flush=True,
+        )
+        errors += failed
+    return errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m toolkit.prewarm")
+    parser.add_argument(
+        "projects",
+        nargs="*",
+        type=Path,
+        help=f"project directories (default: {' '.join(PROJECTS)})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of LaTeX processes (default: cpu count)",
+    )
+    parser.add_argument(
+        "-s", "--scene", action="append", dest="scenes", help="only this scene"
+    )
+    args = parser.parse_args(argv)
+
+    projects = [p.resolve() for p in args.projects] or [ROOT / p for p in PROJECTS]
+    errors = prewarm(projects, args.jobs, args.scenes)
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
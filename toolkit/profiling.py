@@ -0,0 +1,175 @@
+"""Opt-in per-animation profiling of manim renders.
+
+Every `self.play` and `self.wait` call becomes one record holding its source
+line, the animation types, the number of mobjects in the scene, the number of
+frames written and the time spent in updaters, interpolation, rasterisation
+and encoding. Records are written per scene as JSON and as folded stacks,
+which flamegraph.pl, speedscope and inferno read directly.
+
+Usage: python -m toolkit.profiling [--out DIR] -- [manim arguments]
+"""
+
+import argparse
+import functools
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+PHASES = ["updaters", "interpolation", "rasterisation", "encoding"]
+DEFAULT_OUT = Path("media") / "profiles"
+
+
+@dataclass
+class Record:
+    scene: str
+    kind: str
+    file: str
+    line: int
+    animations: list[str] = field(default_factory=list)
+    mobjects: int = 0
+    frames: int = 0
+    cached: bool = False
+    total: float = 0.0
+    phases: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+
+    @property
+    def label(self) -> str:
+        animations = ",".join(self.animations)
+        return f"{Path(self.file).name}:{self.line} {self.kind}({animations})"
+
+
+class Profiler:
+    def __init__(self):
+        self.records: list[Record] = []
+        self.current: Record | None = None
+        self._active: set[str] = set()
+
+    def timed(self, phase: str, function):
+        """Wrap `function` so that its outermost calls count towards `phase`."""
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if self.current is None or phase in self._active:
+                return function(*args, **kwargs)
+            self._active.add(phase)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.current.phases[phase] += time.perf_counter() - start
+                self._active.discard(phase)
+
+        return wrapper
+
+    def recorded(self, kind: str, function):
+        """Wrap `Scene.play` or `Scene.wait` so that each call is one record."""
+
+        @functools.wraps(function)
+        def wrapper(scene, *args, **kwargs):
+            # `wait` is implemented with `play`; only the outer call records.
+            if self.current is not None:
+                return function(scene, *args, **kwargs)
+            caller = sys._getframe(1)
+            record = Record(
+                scene=type(scene).__name__,
+                kind=kind,
+                file=caller.f_code.co_filename,
+                line=caller.f_lineno,
+                mobjects=sum(len(mob.get_family()) for mob in scene.mobjects),
+            )
+            self.current = record
+            start = time.perf_counter()
+            try:
+                return function(scene, *args, **kwargs)
+            finally:
+                record.total = time.perf_counter() - start
+                record.animations = [type(a).__name__ for a in scene.animations or []]
+                record.cached = scene.renderer.skip_animations
+                self.current = None
+                self.records.append(record)
+
+        return wrapper
+
+    def counted_frames(self, function):
+        @functools.wraps(function)
+        def wrapper(renderer, frame, num_frames=1):
+            if self.current is not None and not renderer.skip_animations:
+                self.current.frames += num_frames
+            return function(renderer, frame, num_frames)
+
+        return wrapper
+
+    def install(self) -> None:
+        from manim import Animation, Camera, Scene
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        Scene.play = self.recorded("play", Scene.play)
+        Scene.wait = self.recorded("wait", Scene.wait)
+        Scene.update_mobjects = self.timed("updaters", Scene.update_mobjects)
+        Animation.update_mobjects = self.timed("updaters", Animation.update_mobjects)
+        Animation.interpolate = self.timed("interpolation", Animation.interpolate)
+        Camera.capture_mobjects = self.timed("rasterisation", Camera.capture_mobjects)
+        SceneFileWriter.write_frame = self.timed(
+            "encoding", SceneFileWriter.write_frame
+        )
+        CairoRenderer.add_frame = self.counted_frames(CairoRenderer.add_frame)
+
+    def dump(self, out: Path) -> list[Path]:
+        out.mkdir(parents=True, exist_ok=True)
+        written = []
+        for scene in dict.fromkeys(record.scene for record in self.records):
+            records = [record for record in self.records if record.scene == scene]
+            path = out / f"{scene}.json"
+            path.write_text(json.dumps([asdict(r) for r in records], indent=2))
+            written.append(path)
+
+            # Folded stacks: one line per record and phase, weighted in µs.
+            lines = []
+            for record in records:
+                other = record.total - sum(record.phases.values())
+                for phase, seconds in [*record.phases.items(), ("other", other)]:
+                    if seconds > 0:
+                        lines.append(
+                            f"{scene};{record.label};{phase} {round(seconds * 1e6)}"
+                        )
+            path = out / f"{scene}.folded"
+            path.write_text("\n".join(lines) + "\n")
+            written.append(path)
+        return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m toolkit.profiling")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUT,
+        help=f"directory for the profiles (default: {DEFAULT_OUT})",
+    )
+    parser.add_argument("manim_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    manim_args = (
+        args.manim_args[1:] if args.manim_args[:1] == ["--"] else args.manim_args
+    )
+
+    profiler = Profiler()
+    profiler.install()
+
+    from manim.__main__ import main as manim
+
+    returncode = 0
+    try:
+        manim.main(args=manim_args, prog_name="manim", standalone_mode=False)
+    except SystemExit as error:
+        returncode = error.code if isinstance(error.code, int) else 1
+    finally:
+        for path in profiler.dump(args.out):
+            print(f"Profile written to {path}")
+    return returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
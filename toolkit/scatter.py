@@ -0,0 +1,182 @@
+"""Scatter plots drawn as a handful of mobjects instead of one `Dot` each.
+
+A `DotCloud` keeps every dot of the same colour and opacity in one
+`_DotBatch`, a single VMobject whose points are all of its circles laid end to
+end. The circles are generated from one unit-circle template with array
+arithmetic, so building, copying and interpolating a cloud costs a few NumPy
+operations regardless of the number of dots.
+
+`DotCloud.append` adds dots to a cloud in place. Each batch keeps its points
+at the front of a buffer that doubles when full, so streaming N dots in costs
+O(N) copying in total rather than a rebuilt cloud per step.
+
+Usage:
+    points = DotCloud.from_coords(axes, x, y, color=mm.RED)
+    self.play(mm.Create(points))
+    points.append_coords(axes, more_x, more_y)
+"""
+
+from functools import cache
+
+import manim as mm
+import numpy as np
+
+from .coords import coords_to_points
+
+
+@cache
+def _unit_circle() -> np.ndarray:
+    # The same control points as `mm.Dot`, so clouds and dots transform into
+    # each other curve by curve.
+    return mm.Circle(radius=1).points.copy()
+
+
+def _circles(centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    template = _unit_circle()
+    points = template[None] * radii[:, None, None] + centers[:, None, :]
+    return points.reshape(-1, 3)
+
+
+class _DotBatch(mm.VMobject):
+    def __init__(self, centers, radii, color, opacity, **kwargs):
+        super().__init__(
+            fill_color=color, fill_opacity=opacity, stroke_width=0, **kwargs
+        )
+        self._buffer = None
+        self.set_points(_circles(centers, radii))
+
+    def extend(self, centers: np.ndarray, radii: np.ndarray) -> None:
+        """Append circles at `centers`, copying the old ones only to grow."""
+        circles = _circles(centers, radii)
+        size, end = len(self.points), len(self.points) + len(circles)
+        # Animations and `set_points` replace `points` with a fresh array;
+        # only a view of the buffer can be grown in place.
+        grown = self._buffer is not None and self.points.base is self._buffer
+        if not grown or end > len(self._buffer):
+            buffer = np.empty((max(end, 2 * size), 3))
+            buffer[:size] = self.points
+            self._buffer = buffer
+        self._buffer[size:end] = circles
+        self.points = self._buffer[:end]
+
+    def _dots(self) -> np.ndarray:
+        return self.points.reshape(-1, len(_unit_circle()), 3)
+
+    @property
+    def centers(self) -> np.ndarray:
+        # The template is symmetric, so each circle's control points average
+        # to its centre.
+        return self._dots().mean(axis=1)
+
+    def _repeat_dots(self, count: int) -> None:
+        dots = self._dots()
+        if len(dots) == 0:
+            dots = np.repeat(self.get_center()[None, None], len(_unit_circle()), 1)
+        index = np.arange(count) * len(dots) // count
+        self.set_points(dots[index].reshape(-1, 3))
+
+    def align_points(self, vmobject):
+        if not isinstance(vmobject, _DotBatch):
+            return super().align_points(vmobject)
+        # Pad the smaller batch by splitting its dots, rather than letting
+        # VMobject subdivide the last subpath curve by curve.
+        self.align_rgbas(vmobject)
+        count = max(len(self._dots()), len(vmobject._dots()))
+        for batch in self, vmobject:
+            if len(batch._dots()) != count:
+                batch._repeat_dots(count)
+        return self
+
+
+def _style(batch: _DotBatch) -> tuple:
+    return tuple(batch.get_fill_rgbas()[0])
+
+
+def _radius(batch: _DotBatch) -> float:
+    dots = batch._dots()
+    return float(np.ptp(dots[0, :, 0]) / 2) if len(dots) else mm.DEFAULT_DOT_RADIUS
+
+
+class DotCloud(mm.VMobject):
+    """Dots at `points` (an (N, 2) or (N, 3) array) in one mobject per colour.
+
+    `radius`, `color` and `fill_opacity` are either single values or one value
+    per dot; `color` may also be an (N, 3) array of RGB values.
+    """
+
+    def __init__(
+        self,
+        points,
+        radius=mm.DEFAULT_DOT_RADIUS,
+        color=mm.WHITE,
+        fill_opacity=1.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.append(points, radius, color, fill_opacity)
+
+    def append(
+        self,
+        points,
+        radius=None,
+        color=None,
+        fill_opacity=None,
+    ) -> "DotCloud":
+        """Add dots at `points`, styled like the first batch unless given.
+
+        The radius, colour and opacity default to those of the cloud's first
+        dot. Dots join the batch of their colour and opacity, which grows in
+        place; only a style the cloud has not drawn yet adds a submobject.
+        """
+        first = self.submobjects[0] if self.submobjects else None
+        default = _style(first) if first is not None else (1, 1, 1, 1)
+        if radius is None:
+            radius = _radius(first) if first is not None else mm.DEFAULT_DOT_RADIUS
+        color = mm.ManimColor(default[:3]) if color is None else color
+        fill_opacity = default[3] if fill_opacity is None else fill_opacity
+        centers = np.asarray(points, dtype=float).reshape(-1, np.shape(points)[-1])
+        centers = np.pad(centers, ((0, 0), (0, 3 - centers.shape[1])))
+        count = len(centers)
+        radii = np.broadcast_to(np.asarray(radius, dtype=float), (count,))
+        if isinstance(color, np.ndarray) and color.ndim == 2:
+            rgbs = color[:, :3]
+        elif isinstance(color, (str, mm.ManimColor)):
+            rgbs = mm.color_to_rgb(color)
+        else:
+            rgbs = np.array([mm.color_to_rgb(c) for c in color])
+        styles = np.column_stack(
+            [
+                np.broadcast_to(rgbs, (count, 3)),
+                np.broadcast_to(np.asarray(fill_opacity, dtype=float), (count,)),
+            ]
+        )
+        unique, inverse = np.unique(styles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        batches = {_style(batch): batch for batch in self.submobjects}
+        for i, style in enumerate(unique):
+            if tuple(style) in batches:
+                batches[tuple(style)].extend(centers[inverse == i], radii[inverse == i])
+            else:
+                self.add(
+                    _DotBatch(
+                        centers[inverse == i],
+                        radii[inverse == i],
+                        mm.ManimColor(style[:3]),
+                        style[3],
+                    )
+                )
+        return self
+
+    @classmethod
+    def from_coords(cls, axes, x, y, **kwargs) -> "DotCloud":
+        return cls(coords_to_points(axes, x, y), **kwargs)
+
+    def append_coords(self, axes, x, y, **kwargs) -> "DotCloud":
+        return self.append(coords_to_points(axes, x, y), **kwargs)
+
+    @property
+    def centers(self) -> np.ndarray:
+        """Dot centres, one batch (colour and opacity) after another."""
+        return np.concatenate(
+            [batch.centers for batch in self.submobjects] or [np.zeros((0, 3))]
+        )
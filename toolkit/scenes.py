@@ -0,0 +1,344 @@
+"""Static index of the `Scene` subclasses defined in a project entrypoint.
+
+The index is built from the module AST, so it never imports manim or the
+scientific stack. It lists each scene's line span, the project files it names
+in string literals, the third-party modules it uses, the constant `MathTex`
+and `Tex` expressions it builds and a rough estimate of its duration, and
+feeds build scheduling, the build manifest and the LaTeX prewarm. The analysis
+is stored next to the renders and reused while the entrypoint is unchanged.
+
+Usage: python -m toolkit.scenes [--json] [PROJECT ...]
+"""
+
+import argparse
+import ast
+import json
+import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+ENTRYPOINT = "main.py"
+INDEX_CACHE = Path("media") / "scene-index.json"
+CODE_DIR = Path("assets") / "codes"
+INDEX_VERSION = 3
+DEFAULT_RUN_TIME = 1.0
+TEX_CLASSES = {"MathTex", "Tex"}
+# Keywords that change what LaTeX compiles; calls using them are not indexed.
+TEX_COMPILE_KEYWORDS = {"arg_separator", "tex_environment", "tex_template"}
+
+
+@dataclass(frozen=True)
+class SceneInfo:
+    name: str
+    lineno: int
+    end_lineno: int
+    source: str
+    bases: tuple[str, ...]
+    assets: tuple[Path, ...]
+    modules: frozenset[str]
+    tex: tuple[tuple[str, tuple[str, ...]], ...]
+    plays: int
+    duration: float
+
+    @property
+    def uses_scipy(self) -> bool:
+        return "scipy" in self.modules
+
+    @property
+    def uses_sklearn(self) -> bool:
+        return "sklearn" in self.modules
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "lines": [self.lineno, self.end_lineno],
+            "bases": list(self.bases),
+            "assets": [str(path) for path in self.assets],
+            "modules": sorted(self.modules),
+            "uses_scipy": self.uses_scipy,
+            "uses_sklearn": self.uses_sklearn,
+            "tex": [[kind, list(args)] for kind, args in self.tex],
+            "plays": self.plays,
+            "duration": self.duration,
+        }
+
+
+@dataclass(frozen=True)
+class SceneIndex:
+    project: Path
+    preamble: str
+    scenes: dict[str, SceneInfo]
+
+    @classmethod
+    def load(cls, project: Path) -> "SceneIndex":
+        path = (project / ENTRYPOINT).resolve()
+        stat = path.stat()
+        return _load(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _is_scene_base(base: ast.expr, scenes: set[str]) -> bool:
+    # Matches `Scene` (from `from manim import *`), `mm.Scene` and subclasses
+    # of scenes defined earlier in the module.
+    if isinstance(base, ast.Name):
+        return base.id == "Scene" or base.id in scenes
+    if isinstance(base, ast.Attribute):
+        return base.attr == "Scene"
+    return False
+
+
+def _imported_modules(nodes) -> dict[str, str]:
+    """Map the names bound by import statements to their top-level module."""
+    names = {}
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names[alias.asname or alias.name.partition(".")[0]] = alias.name
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for alias in node.names:
+                names[alias.asname or alias.name] = node.module
+    return {name: module.partition(".")[0] for name, module in names.items()}
+
+
+def _path_literals(nodes) -> list[str]:
+    return sorted(
+        {
+            node.value
+            for node in nodes
+            if isinstance(node, ast.Constant)
+            and isinstance(node.value, str)
+            and 0 < len(node.value) <= 255
+            and "\n" not in node.value
+        }
+    )
+
+
+def _find_file(project: Path, name: str) -> Path | None:
+    # `Code` looks in `assets/codes` before the working directory.
+    for path in (project / CODE_DIR / name, project / name):
+        if path.is_file():
+            return path.resolve()
+    return None
+
+
+def referenced_files(project: Path, literals: list[str]) -> tuple[Path, ...]:
+    """Return the existing project files named by `literals`."""
+    # Resolved on every load rather than cached, so that adding an asset
+    # changes the scene hash even if the entrypoint did not change.
+    found = (_find_file(project, s) for s in literals)
+    return tuple(sorted({path for path in found if path is not None}))
+
+
+def _tex_calls(nodes) -> list[list]:
+    """`[class name, [strings]]` of every `MathTex`/`Tex` built from constants."""
+    calls = []
+    for node in nodes:
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+        if (
+            name in TEX_CLASSES
+            and node.args
+            and all(
+                isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+                for arg in node.args
+            )
+            and not any(kw.arg in TEX_COMPILE_KEYWORDS for kw in node.keywords)
+        ):
+            call = [name, [arg.value for arg in node.args]]
+            if call not in calls:
+                calls.append(call)
+    return calls
+
+
+def _constant(node: ast.expr | None, default: float) -> float:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return float(node.value)
+    return default
+
+
+def _self_call(node: ast.AST, method: str) -> ast.Call | None:
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == method
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "self"
+    ):
+        return node
+    return None
+
+
+def _repetitions(node: ast.For) -> int:
+    # `for _ in range(3)` is the only loop whose trip count matters here.
+    call = node.iter
+    if (
+        isinstance(call, ast.Call)
+        and isinstance(call.func, ast.Name)
+        and call.func.id == "range"
+        and len(call.args) == 1
+    ):
+        return int(_constant(call.args[0], 1))
+    return 1
+
+
+def _timeline(nodes: list[ast.stmt]) -> tuple[int, float]:
+    """Count the `self.play` calls and estimate the seconds of animation."""
+    plays, duration = 0, 0.0
+    for node in nodes:
+        if isinstance(node, (ast.For, ast.While)):
+            count = _repetitions(node) if isinstance(node, ast.For) else 1
+            body_plays, body_duration = _timeline(node.body)
+            plays += count * body_plays
+            duration += count * body_duration
+            continue
+        for child in ast.walk(node):
+            if call := _self_call(child, "play"):
+                run_time = next(
+                    (kw.value for kw in call.keywords if kw.arg == "run_time"), None
+                )
+                plays += 1
+                duration += _constant(run_time, DEFAULT_RUN_TIME)
+            elif call := _self_call(child, "wait"):
+                duration += _constant(
+                    call.args[0] if call.args else None, DEFAULT_RUN_TIME
+                )
+    return plays, duration
+
+
+@dataclass
+class _Analysis:
+    name: str
+    lineno: int
+    end_lineno: int
+    source: str
+    bases: list[str]
+    literals: list[str]
+    modules: list[str]
+    tex: list[list]
+    plays: int
+    duration: float
+
+
+def _analyse_scene(
+    lines: list[str], node: ast.ClassDef, imports: dict[str, str], scenes: set[str]
+) -> _Analysis:
+    children = list(ast.walk(node))
+    modules = set(_imported_modules(children).values())
+    modules.update(
+        imports[child.id]
+        for child in children
+        if isinstance(child, ast.Name) and child.id in imports
+    )
+    body = [
+        stmt
+        for child in node.body
+        if isinstance(child, ast.FunctionDef)
+        for stmt in child.body
+    ]
+    plays, duration = _timeline(body)
+    return _Analysis(
+        name=node.name,
+        lineno=node.lineno,
+        end_lineno=node.end_lineno or node.lineno,
+        source=_segment(lines, node),
+        bases=[
+            base.id
+            for base in node.bases
+            if isinstance(base, ast.Name) and base.id in scenes
+        ],
+        literals=_path_literals(children),
+        modules=sorted(modules),
+        tex=_tex_calls(children),
+        plays=plays,
+        duration=duration,
+    )
+
+
+def _segment(lines: list[str], node: ast.stmt) -> str:
+    # Top-level statements span whole lines; slicing them is much cheaper
+    # than `ast.get_source_segment`, which re-splits the source every call.
+    return "".join(lines[node.lineno - 1 : node.end_lineno])
+
+
+def _analyse(source: str, filename: str) -> dict:
+    tree = ast.parse(source, filename=filename)
+    lines = source.splitlines(keepends=True)
+    imports = _imported_modules(tree.body)
+
+    preamble, scenes = [], {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and any(
+            _is_scene_base(base, set(scenes)) for base in node.bases
+        ):
+            scenes[node.name] = _analyse_scene(lines, node, imports, set(scenes))
+        else:
+            preamble.append(_segment(lines, node))
+    return {
+        "preamble": "".join(preamble),
+        "scenes": [asdict(analysis) for analysis in scenes.values()],
+    }
+
+
+@lru_cache(maxsize=None)
+def _load(path: Path, mtime_ns: int, size: int) -> SceneIndex:
+    project = path.parent
+    key = {"version": INDEX_VERSION, "mtime_ns": mtime_ns, "size": size}
+    cache = project / INDEX_CACHE
+    try:
+        cached = json.loads(cache.read_text(encoding="utf-8"))
+        analysis = cached["analysis"] if cached["key"] == key else None
+    except (OSError, ValueError, KeyError):
+        analysis = None
+    if analysis is None:
+        analysis = _analyse(path.read_text(encoding="utf-8"), str(path))
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_text(json.dumps({"key": key, "analysis": analysis}))
+        except OSError:
+            pass
+
+    scenes = {}
+    for item in analysis["scenes"]:
+        item = _Analysis(**item)
+        scenes[item.name] = SceneInfo(
+            name=item.name,
+            lineno=item.lineno,
+            end_lineno=item.end_lineno,
+            source=item.source,
+            bases=tuple(item.bases),
+            assets=referenced_files(project, item.literals),
+            modules=frozenset(item.modules),
+            tex=tuple((kind, tuple(args)) for kind, args in item.tex),
+            plays=item.plays,
+            duration=item.duration,
+        )
+    return SceneIndex(project, analysis["preamble"], scenes)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m toolkit.scenes")
+    parser.add_argument("projects", nargs="*", type=Path, default=[Path(".")])
+    parser.add_argument("--json", action="store_true", help="print the full index")
+    args = parser.parse_args(argv)
+
+    indexes = [SceneIndex.load(project) for project in args.projects]
+    if args.json:
+        json.dump(
+            {
+                str(index.project): [info.to_dict() for info in index.scenes.values()]
+                for index in indexes
+            },
+            sys.stdout,
+            indent=2,
+            ensure_ascii=False,
+        )
+        print()
+    else:
+        print(" ".join(name for index in indexes for name in index.scenes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Many straight segments, such as residuals, drawn as a single VMobject.
+
+Every segment is one cubic curve with its handles at a third and two thirds
+of the way, which is exactly how `mm.Line` is built, so a `SegmentBatch`
+looks like a `VGroup` of lines and draws one segment after another under
+`Create` and `Write`.
+
+Usage:
+    residuals = SegmentBatch.from_coords(axes, x, y, x, f(x), color=mm.YELLOW)
+    self.play(mm.Create(residuals))
+"""
+
+import manim as mm
+import numpy as np
+
+from .coords import coords_to_points
+
+_HANDLES = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+
+
+class SegmentBatch(mm.VMobject):
+    """Segments from each row of `starts` to the same row of `ends`."""
+
+    def __init__(self, starts, ends, **kwargs):
+        super().__init__(**kwargs)
+        self.set_segments(starts, ends)
+
+    @classmethod
+    def from_coords(cls, axes, x0, y0, x1, y1, **kwargs) -> "SegmentBatch":
+        x0, y0, x1, y1 = np.broadcast_arrays(x0, y0, x1, y1)
+        return cls(
+            coords_to_points(axes, x0, y0), coords_to_points(axes, x1, y1), **kwargs
+        )
+
+    def set_segments(self, starts, ends) -> "SegmentBatch":
+        starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        points = starts[:, None] + _HANDLES * (ends - starts)[:, None]
+        self.set_points(points.reshape(-1, 3))
+        return self
+
+    def _segments(self) -> np.ndarray:
+        return self.points.reshape(-1, self.n_points_per_cubic_curve, 3)
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self._segments()[:, 0]
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self._segments()[:, -1]
+
+    def split(self) -> mm.VGroup:
+        """One VMobject per segment, for transforms into per-segment targets."""
+        return mm.VGroup(
+            *[mm.VMobject().set_points(segment) for segment in self._segments()]
+        ).match_style(self)
@@ -0,0 +1,117 @@
+"""Measure the time from process start to the first frame of a scene.
+
+Each sample starts a fresh interpreter, imports the project entrypoint the way
+manim does and constructs the scene up to its first `play` or `wait`, which is
+where the first frame would be rendered. With `--rev`, the entrypoint as of a
+git revision is measured as well, for before/after comparisons.
+
+Usage: python -m toolkit.startup [--rev REV] [-n RUNS] PROJECT [SCENE ...]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .build import ROOT, render_env
+from .scenes import ENTRYPOINT, SceneIndex
+
+MARKER = "first-frame"
+
+
+def _child(entrypoint: str, scene: str) -> None:
+    import importlib.util
+
+    import manim
+
+    def first_frame(*args, **kwargs):
+        print(MARKER, flush=True)
+        os._exit(0)
+
+    manim.Scene.play = first_frame
+    manim.Scene.wait = first_frame
+
+    spec = importlib.util.spec_from_file_location("main", entrypoint)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    getattr(module, scene)().render()
+    # A scene without any animation never reaches the first frame.
+    os._exit(1)
+
+
+def sample(project: Path, entrypoint: str, scene: str) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "toolkit.startup", "--child", entrypoint, scene],
+        cwd=project,
+        env=render_env(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    for line in process.stdout:
+        if line.strip() == MARKER:
+            elapsed = time.perf_counter() - start
+            break
+    else:
+        elapsed = float("nan")
+    process.wait()
+    return elapsed
+
+
+def measure(project: Path, entrypoint: str, scenes: list[str], runs: int) -> dict:
+    return {
+        scene: statistics.median(
+            sample(project, entrypoint, scene) for _ in range(runs)
+        )
+        for scene in scenes
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None and sys.argv[1:2] == ["--child"]:
+        _child(*sys.argv[2:4])
+
+    parser = argparse.ArgumentParser(prog="python -m toolkit.startup")
+    parser.add_argument("project", type=Path)
+    parser.add_argument("scenes", nargs="*")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="samples per scene")
+    parser.add_argument("--rev", help="also measure the entrypoint at this revision")
+    args = parser.parse_args(argv)
+
+    project = args.project.resolve()
+    scenes = args.scenes or list(SceneIndex.load(project).scenes)
+    columns = {"working tree": measure(project, ENTRYPOINT, scenes, args.runs)}
+    if args.rev:
+        # Written next to the entrypoint so relative asset paths still resolve.
+        entrypoint = project / f".startup-{os.getpid()}.py"
+        source = subprocess.run(
+            ["git", "show", f"{args.rev}:{project.relative_to(ROOT) / ENTRYPOINT}"],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+        ).stdout
+        entrypoint.write_bytes(source)
+        try:
+            columns = {
+                args.rev: measure(project, entrypoint.name, scenes, args.runs),
+                **columns,
+            }
+        finally:
+            entrypoint.unlink()
+
+    width = max(map(len, scenes))
+    print(f"{'scene':<{width}}" + "".join(f"{name:>16}" for name in columns))
+    for scene in scenes:
+        times = "".join(
+            f"{column[scene] * 1000:>14.0f}ms" for column in columns.values()
+        )
+        print(f"{scene:<{width}}{times}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Least-squares lines that follow a stream of observations.
+
+A `RunningLinearFit` keeps only the count, means and centred second moments
+of what it has seen, so each observation costs O(1) whatever came before, and
+a whole batch is folded in with a few array reductions. The slope and
+intercept are available at any point and equal those of `np.polyfit(x, y, 1)`
+on everything observed so far.
+
+Usage:
+    fit = RunningLinearFit()
+    for x, y in stream:
+        fit.update(x, y)
+        self.play(a.animate.set_value(fit.slope), b.animate.set_value(fit.intercept))
+"""
+
+import numpy as np
+
+
+class RunningLinearFit:
+    """Ordinary least-squares line `y = slope * x + intercept` of a stream.
+
+    The sufficient statistics Σx, Σy, Σxy and Σx² are held as means and
+    centred sums, which carry the same information without the cancellation
+    raw sums suffer once millions of samples have been added.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+
+    def update(self, x, y) -> "RunningLinearFit":
+        """Observe `y` at `x` (scalars or equally long arrays)."""
+        x = np.ravel(np.asarray(x, dtype=float))
+        y = np.ravel(np.asarray(y, dtype=float))
+        m = len(x)
+        if m == 0:
+            return self
+        mean_x, mean_y = x.mean(), y.mean()
+        dx = x - mean_x
+        # Chan et al.'s pairwise update: merge the batch's own moments with
+        # the running ones, correcting for the distance between their means.
+        n = self.n + m
+        delta_x = mean_x - self.mean_x
+        delta_y = mean_y - self.mean_y
+        weight = self.n * m / n
+        self.sxx += dx @ dx + weight * delta_x * delta_x
+        self.sxy += dx @ (y - mean_y) + weight * delta_x * delta_y
+        self.mean_x += delta_x * m / n
+        self.mean_y += delta_y * m / n
+        self.n = n
+        return self
+
+    @property
+    def slope(self) -> float:
+        return self.sxy / self.sxx if self.sxx > 0 else 0.0
+
+    @property
+    def intercept(self) -> float:
+        return self.mean_y - self.slope * self.mean_x